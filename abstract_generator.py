@@ -10,8 +10,9 @@ while also incorporating a metafictional element.
 import random
 import metafiction
 from json_data_provider import philosophers, concepts, terms, philosopher_concepts, thematic_clusters
-from coherence import EssayCoherence
+from coherence import EssayCoherence, get_philosophers_by_concept
 from collections import Counter
+from itertools import chain
 
 def find_relevant_philosophers(current_concepts, current_terms, coherence_manager_instance: EssayCoherence):
     """
@@ -33,10 +34,9 @@ def find_relevant_philosophers(current_concepts, current_terms, coherence_manage
         relevant_philosophers.update(coherence_manager_instance.active_theme_data.get('core_philosophers', []))
 
     # Add philosophers strongly associated with the current concepts/terms via philosopher_concepts
+    philosophers_by_concept = get_philosophers_by_concept(philosopher_concepts)
     for concept_item in current_concepts + current_terms: # Terms can sometimes map to philosopher specialties
-        for philosopher, philo_concepts_list in philosopher_concepts.items():
-            if concept_item in philo_concepts_list:
-                relevant_philosophers.add(philosopher)
+        relevant_philosophers.update(philosophers_by_concept.get(concept_item, ()))
     
     # If still not enough, get weighted philosophers from coherence manager
     attempts = 0
@@ -226,22 +226,26 @@ def generate_enhanced_abstract(coherence_manager: EssayCoherence, title_themes=N
     keyword_candidates = {str(k) for k in keyword_candidates if k}
 
     # Weight keywords: title themes and active theme elements get higher preference
+    title_keyword_set = set()
+    if title_themes:
+        title_keyword_set.update(title_themes.get('primary_concepts', []))
+        title_keyword_set.update(title_themes.get('primary_terms', []))
+    theme_keyword_set = set()
+    if coherence_manager.active_theme_key:
+        theme_keyword_set.update(coherence_manager.active_theme_data.get('key_concepts', []))
+        theme_keyword_set.update(coherence_manager.active_theme_data.get('relevant_terms', []))
+        theme_keyword_set.update(coherence_manager.active_theme_data.get('core_philosophers', []))
     weighted_keywords = Counter()
     for kw in keyword_candidates:
         weight = 1
-        if title_themes and (kw in title_themes.get('primary_concepts', []) or kw in title_themes.get('primary_terms', [])):
+        if kw in title_keyword_set:
             weight += 5
-        if coherence_manager.active_theme_key and \
-           (kw in coherence_manager.active_theme_data.get('key_concepts', []) or \
-            kw in coherence_manager.active_theme_data.get('relevant_terms', []) or \
-            kw in coherence_manager.active_theme_data.get('core_philosophers', [])):
+        if kw in theme_keyword_set:
             weight += 3
         if kw in coherence_manager.concept_weights or kw in coherence_manager.term_weights or kw in coherence_manager.philosopher_weights:
              weight += coherence_manager.concept_weights.get(kw,0) + coherence_manager.term_weights.get(kw,0) + coherence_manager.philosopher_weights.get(kw,0)
         weighted_keywords[kw] = weight
     
-    ranked_keywords = [kw for kw, _ in weighted_keywords.most_common()]
-
     # Select top 5 keywords, exhausting theme-local/title-local material first.
     num_keywords = 5
     preferred_keyword_order = []
@@ -285,7 +289,9 @@ def generate_enhanced_abstract(coherence_manager: EssayCoherence, title_themes=N
             break
 
     if len(selected_keywords) < num_keywords:
-        for keyword in ranked_keywords:
+        # At most num_keywords ranked entries are ever visited (each is either appended
+        # or already selected), so only the top of the ranking is needed
+        for keyword, _ in weighted_keywords.most_common(num_keywords):
             if keyword not in selected_keywords:
                 selected_keywords.append(keyword)
             if len(selected_keywords) == num_keywords:
@@ -303,21 +309,17 @@ def generate_enhanced_abstract(coherence_manager: EssayCoherence, title_themes=N
     
     # If still not 5 keywords, pad with random keywords from the general pool (even if repeated, though unlikely with sufficient candidates)
     # This step is crucial to guarantee exactly 5 keywords.
-    while len(selected_keywords) < num_keywords:
-        # Create a combined pool that allows duplicates if necessary to reach 5
-        # This is a last resort and ideally, the previous steps should yield enough unique keywords.
-        combined_pool = list(concepts) + list(terms) + list(philosophers)
+    if len(selected_keywords) < num_keywords:
+        combined_pool = list(dict.fromkeys(chain(concepts, terms, philosophers)))
         if not combined_pool: # Should not happen if data.json is populated
-            selected_keywords.append("keyword") # Absolute fallback
-            continue
-        
-        # Try to pick a keyword not already selected if possible
-        potential_keyword = random.choice(combined_pool)
-        # Add if not already present or if we absolutely need to fill spots (allow duplicates as last resort)
-        if potential_keyword not in selected_keywords or len(selected_keywords) < num_keywords - (len(set(selected_keywords)) - len(selected_keywords) +1) : # crude duplicate allowance logic
-             selected_keywords.append(potential_keyword)
-        elif len(combined_pool) <= num_keywords : # if pool is small, allow duplicates
-             selected_keywords.append(potential_keyword)
+            combined_pool = ["keyword"] # Absolute fallback
+        # Filter the pool once instead of redrawing until an unused keyword turns up
+        unused_pool = [keyword for keyword in combined_pool if keyword not in selected_keywords]
+        additional_needed = num_keywords - len(selected_keywords)
+        selected_keywords.extend(random.sample(unused_pool, min(additional_needed, len(unused_pool))))
+        # Allow duplicates only as a last resort when the pool is too small
+        while len(selected_keywords) < num_keywords:
+            selected_keywords.append(random.choice(combined_pool))
 
 
     # Ensure exactly num_keywords are taken, even if padding added more temporarily (though logic above tries to be exact)
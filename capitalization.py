@@ -11,6 +11,65 @@ from json_data_provider import philosophers, concepts, italicized_terms, terms,
 
 LOWERCASE_AUTHORS = ["bell hooks"] # Add other authors if needed
 
+# Lowercased words of every philosopher name and proper noun (plus each whole proper noun),
+# so title casing can test a word with one set lookup instead of rescanning both lists
+_PROPER_NOUN_WORDS = frozenset(
+    [word for philosopher in philosophers for word in philosopher.lower().split()]
+    + [word for pn in PROPER_NOUNS for word in pn.lower().split()]
+    + [pn.lower() for pn in PROPER_NOUNS]
+)
+
+# Each italicized term's lowercase form paired with its whole-word pattern, so italicization
+# can skip absent terms with a substring check before running any regex. Patterns are compiled
+# on first use (see _get_compiled_pattern), so only terms that actually occur pay for it.
+_ITALICIZED_TERM_PATTERNS = tuple(
+    (term.lower(), r'\b' + re.escape(term) + r'\b')
+    for term in italicized_terms
+)
+
+# Whole-word patterns for every capitalization rule in ensure_proper_capitalization, in the
+# order the rules apply, each paired with the lowercase needle that must occur for it to match.
+# The rules only change letter case, so one lowered copy of the text gates all of them.
+_PHILOSOPHER_CASE_RULES = tuple(
+    (needle, r'\b' + re.escape(needle) + r'\b', replacement)
+    for philosopher in philosophers
+    if philosopher.lower() not in LOWERCASE_AUTHORS
+    for needle, replacement in (
+        [(philosopher.lower(), philosopher)]
+        + ([(philosopher.split()[-1].lower(), philosopher.split()[-1])] if len(philosopher.split()) > 1 else [])
+    )
+)
+_PROPER_NOUN_CASE_RULES = tuple(
+    (proper_noun.lower(), r'\b' + re.escape(proper_noun) + r'\b', proper_noun)
+    for proper_noun in PROPER_NOUNS
+)
+_NAME_SUFFIX_CASE_RULES = tuple(
+    (suffix.lower(), r'\b' + re.escape(suffix.lower()) + r'\b', suffix)
+    for suffix in NAME_SUFFIXES
+)
+
+# Case-insensitive compiled forms of the rule and italics patterns above, filled on first use.
+# Keeping them here rather than in re's own bounded cache means they are compiled once per
+# process no matter how much other regex work runs in between.
+_compiled_patterns = {}
+
+def _get_compiled_pattern(pattern):
+    """Return the case-insensitive compiled form of pattern, compiling it on first use."""
+    compiled = _compiled_patterns.get(pattern)
+    if compiled is None:
+        compiled = _compiled_patterns[pattern] = re.compile(pattern, re.IGNORECASE)
+    return compiled
+
+# Title splitting on whitespace and around delimiters that are followed by a capitalized word;
+# the delimiters themselves are kept in the split results
+_TITLE_SPLIT_PATTERN = re.compile(r'(\s+|(?<=[:/\-–—])|(?=[:/\-–—]))')
+_TITLE_DELIMITERS = frozenset([':', '/', '-', '–', '—'])
+# Delimiters joined without surrounding spaces
+_TITLE_TIGHT_DELIMITERS = frozenset(['/', '-', '–', '—'])
+
+# Punctuation stripped from each title word before the small-word and proper-noun checks
+_TITLE_WORD_PUNCTUATION_PATTERN = re.compile(r'[^\w\s]')
+
 def ensure_proper_capitalization(text, capitalize_first=True):
     """
     Ensure proper capitalization of philosopher names and sentence beginnings.
@@ -37,34 +96,20 @@ def ensure_proper_capitalization(text, capitalize_first=True):
         # Specifically for "hooks, bell" at the start of a line (common in bibliography)
         text = re.sub(r'^(hooks, bell)\b', "hooks, bell", text, flags=re.IGNORECASE)
 
-    # Capitalize philosopher names first
-    for philosopher in philosophers:
-        if philosopher.lower() in LOWERCASE_AUTHORS: # Skip if it's a special lowercase author
-            continue
-        # Ensure we match whole words only and handle partial names (last names)
-        full_name_pattern = r'\b' + re.escape(philosopher.lower()) + r'\b'
-        text = re.sub(full_name_pattern, philosopher, text, flags=re.IGNORECASE)
-        
-        # Also handle last names only by splitting the philosopher name and matching the last part
-        name_parts = philosopher.split()
-        if len(name_parts) > 1:
-            last_name = name_parts[-1]
-            last_name_pattern = r'\b' + re.escape(last_name.lower()) + r'\b'
-            text = re.sub(last_name_pattern, last_name, text, flags=re.IGNORECASE)
+    text_lower = text.lower()
 
-    # Capitalize other proper nouns
-    for proper_noun in PROPER_NOUNS:
-        # Ensure we match whole words only
-        # Proper nouns in the list should be in their correct case already
-        pn_pattern = r'\b' + re.escape(proper_noun) + r'\b' 
-        # We use a lambda for replacement to ensure we replace with the exact case from PROPER_NOUNS list
-        # This is important if a proper noun might appear in various incorrect cases in the raw text.
-        text = re.sub(pn_pattern, lambda match: proper_noun, text, flags=re.IGNORECASE)
-    
-    # Handle special suffixes that should always be capitalized
-    for suffix in NAME_SUFFIXES:
-        suffix_pattern = r'\b' + re.escape(suffix.lower()) + r'\b'
-        text = re.sub(suffix_pattern, suffix, text, flags=re.IGNORECASE)
+    # Capitalize philosopher names first (full names, then last names only), then other
+    # proper nouns, then special suffixes that should always be capitalized
+    for needle, pattern, replacement in _PHILOSOPHER_CASE_RULES:
+        if needle in text_lower:
+            text = _get_compiled_pattern(pattern).sub(replacement, text)
+    for needle, pattern, proper_noun in _PROPER_NOUN_CASE_RULES:
+        if needle in text_lower:
+            # Use a lambda so the exact case from PROPER_NOUNS is inserted verbatim
+            text = _get_compiled_pattern(pattern).sub(lambda match, proper_noun=proper_noun: proper_noun, text)
+    for needle, pattern, suffix in _NAME_SUFFIX_CASE_RULES:
+        if needle in text_lower:
+            text = _get_compiled_pattern(pattern).sub(suffix, text)
     
     # Only handle sentence capitalization if requested
     if capitalize_first:
@@ -145,6 +190,11 @@ def ensure_proper_capitalization_with_italics(text, capitalize_first=True):
     
     return ''.join(processed_parts)
 
+# Title-cased results keyed by input title; the same template-built titles and
+# headings recur across reference, note and section generation
+_title_case_cache = {}
+_TITLE_CASE_CACHE_SIZE = 1024
+
 # In capitalization.py, the issue with improper capitalization is in the apply_title_case function:
 
 def apply_title_case(title):
@@ -160,12 +210,23 @@ def apply_title_case(title):
     """
     if not title:
         return title
+
+    cached = _title_case_cache.get(title)
+    if cached is not None:
+        return cached
+
+    formatted_title = _format_title_case(title)
+    if len(_title_case_cache) >= _TITLE_CASE_CACHE_SIZE:
+        _title_case_cache.clear()
+    _title_case_cache[title] = formatted_title
+    return formatted_title
+
+def _format_title_case(title):
+    """Title-case a non-empty title string; apply_title_case memoizes the result."""
     
     # Special handling for splitting by both spaces and certain delimiters that should have
     # capitalization after them (colon, slash, etc.)
-    # We'll preserve the delimiters in the split results
-    split_pattern = r'(\s+|(?<=[:/\-–—])|(?=[:/\-–—]))'
-    raw_parts = re.split(split_pattern, title)
+    raw_parts = _TITLE_SPLIT_PATTERN.split(title)
     
     # Recombine parts into words, keeping track of delimiters
     words = []
@@ -176,7 +237,7 @@ def apply_title_case(title):
                 words.append(current_word)
                 current_word = ""
             continue
-        elif part in [':', '/', '-', '–', '—']:  # This is a delimiter
+        elif part in _TITLE_DELIMITERS:  # This is a delimiter
             if current_word:
                 words.append(current_word)
                 words.append(part)
@@ -196,31 +257,20 @@ def apply_title_case(title):
     
     for i, word in enumerate(words):
         # Check if this is a delimiter
-        if word in [':', '/', '-', '–', '—']:
+        if word in _TITLE_DELIMITERS:
             result.append(word)
             capitalize_next = True  # Capitalize the word after a delimiter
             continue
         
+        # Lowercase once; the punctuation-free form and the author check both reuse it
+        word_lower = word.lower()
+
         # Remove any punctuation for checking against lowercase words
-        clean_word = re.sub(r'[^\w\s]', '', word.lower())
+        clean_word = _TITLE_WORD_PUNCTUATION_PATTERN.sub('', word_lower)
         
-        # Special case for proper nouns (matching philosophers, concepts with capital letters)
-        is_proper_noun = False
-        for philosopher in philosophers:
-            if clean_word.lower() in philosopher.lower().split():
-                is_proper_noun = True
-                break
-        # Check against the PROPER_NOUNS list as well
-        if not is_proper_noun:
-            # We check the clean_word (lowercase, no punctuation) against a lowercased version of proper nouns
-            # This makes the matching more robust against minor variations or if the proper noun itself contains punctuation
-            # (though PROPER_NOUNS list should ideally have clean entries).
-            for pn in PROPER_NOUNS:
-                # Simple check: if clean_word is part of a proper noun (e.g. "kantian" in "Kantian Ethics")
-                # or if the proper noun is exactly the clean_word
-                if clean_word in pn.lower().split() or clean_word == pn.lower():
-                    is_proper_noun = True
-                    break
+        # Special case for proper nouns (matching philosophers and the PROPER_NOUNS list,
+        # e.g. "kantian" in "Kantian Ethics")
+        is_proper_noun = clean_word in _PROPER_NOUN_WORDS
         
         # Special handling for title words - in reference titles, we should capitalize most words
         # except for very small connector words when they're not the first word or last word
@@ -241,9 +291,9 @@ def apply_title_case(title):
         # But only when they're not the first or last word
         
         # Check for special lowercase authors
-        if word.lower() in LOWERCASE_AUTHORS:
+        if word_lower in LOWERCASE_AUTHORS:
             should_capitalize = False
-            word = word.lower() # Ensure it is lowercase
+            word = word_lower # Ensure it is lowercase
         else:
             should_capitalize = (capitalize_next or  # First word or after delimiter
                                not is_small_word or   # Not a small connector word
@@ -264,7 +314,7 @@ def apply_title_case(title):
             # Make lowercase unless it's a proper noun
             if not is_proper_noun:
                 if word and word[0].isalpha():
-                    word = word.lower()
+                    word = word_lower
         
         result.append(word)
         capitalize_next = False  # Reset for next word unless it's after a delimiter
@@ -272,7 +322,7 @@ def apply_title_case(title):
     # Join the words back together with modified delimiter handling
     formatted_title = ""
     for i, part in enumerate(result):
-        if part in ['/', '-', '–', '—']:  # No spaces around slashes and dashes
+        if part in _TITLE_TIGHT_DELIMITERS:  # No spaces around slashes and dashes
             # No space before or after a slash or dash
             formatted_title = formatted_title.rstrip()
             formatted_title += part
@@ -284,7 +334,7 @@ def apply_title_case(title):
                 formatted_title += " "
         else:
             # Regular word - add with space if not the first word and previous isn't a slash or dash
-            if i > 0 and result[i-1] not in ['/', '-', '–', '—']:
+            if i > 0 and result[i-1] not in _TITLE_TIGHT_DELIMITERS:
                 formatted_title += " "
             formatted_title += part
     
@@ -333,13 +383,16 @@ def italicize_terms_in_text(text):
     for match in re.finditer(r'\*([^*]+)\*', text):
         italicized_sections.append((match.start(), match.end()))
     
+    # Inserting asterisks never creates a new term occurrence, so one lowered copy suffices
+    text_lower = text.lower()
+
     # For each term that should be italicized
-    for term in italicized_terms:
-        # Look for the term with word boundaries
-        pattern = r'\b' + re.escape(term) + r'\b'
-        
+    for term_lower, pattern in _ITALICIZED_TERM_PATTERNS:
+        if term_lower not in text_lower:
+            continue
+
         # Find all occurrences
-        for match in re.finditer(pattern, text, re.IGNORECASE):
+        for match in _get_compiled_pattern(pattern).finditer(text):
             start, end = match.span()
             
             # Check if this match is already within an italicized section
@@ -20,6 +20,25 @@ from json_data_provider import (
 
 # oppositional_pairs = []     # Will be imported from data.py
 
+_concept_relationship_cache = {}
+_philosopher_indexes = {}
+
+def get_philosophers_by_concept(philosopher_concepts):
+    """
+    Return a cached concept -> philosophers index inverted from philosopher_concepts.
+    Each concept lists its philosophers once, in philosopher_concepts order.
+    """
+    cached = _philosopher_indexes.get(id(philosopher_concepts))
+    if cached is None or cached[0] is not philosopher_concepts:
+        index = defaultdict(list)
+        for philosopher, philo_concepts in philosopher_concepts.items():
+            for concept in philo_concepts:
+                if not index[concept] or index[concept][-1] != philosopher:
+                    index[concept].append(philosopher)
+        cached = (philosopher_concepts, dict(index))
+        _philosopher_indexes[id(philosopher_concepts)] = cached
+    return cached[1]
+
 class EssayCoherence:
     """
     Class for managing thematic unity and conceptual coherence in essay generation.
@@ -63,7 +82,7 @@ class EssayCoherence:
         self.philosopher_concepts = philosopher_concepts # Imported from data.py
         self.philosopher_key_works = philosopher_key_works # Imported from data.py
 
-        self.concept_relationships = self._build_concept_relationships()
+        self.concept_relationships = self._get_concept_relationships()
 
         if theme_key and theme_key in thematic_clusters:
             self.set_active_theme(theme_key)
@@ -218,6 +237,19 @@ class EssayCoherence:
         # Potentially add philosophers mentioned in title themes if any logic for that exists
         # For now, primarily focusing on concepts and terms from title.
 
+    def _get_concept_relationships(self):
+        """
+        Return the concept relationship graph shared by every manager built over the same data.
+        The graph depends only on the loaded vocabulary, so it is built once per process
+        rather than once per essay; callers only ever read from it.
+        """
+        key = (id(self.concepts), id(self.philosopher_concepts))
+        cached = _concept_relationship_cache.get(key)
+        if cached is None or cached[0] is not self.concepts or cached[1] is not self.philosopher_concepts:
+            cached = (self.concepts, self.philosopher_concepts, self._build_concept_relationships())
+            _concept_relationship_cache[key] = cached
+        return cached[2]
+
     def _build_concept_relationships(self):
         """Build a graph of related concepts with strength and type, including explicit typed relations."""
         relationships = defaultdict(lambda: defaultdict(lambda: {"strength": 0, "type": "related"}))
@@ -398,7 +430,8 @@ class EssayCoherence:
             subset_as_set = set(subset)
             target_item_list = [item for item in item_list if item in subset_as_set]
 
-        exclude_set = set(exclude_set or set())
+        if not isinstance(exclude_set, (set, frozenset)):
+            exclude_set = set(exclude_set or ())
         available_items = [item for item in target_item_list if item not in exclude_set]
 
         if not available_items: # Fallback if all items are excluded or list is empty
@@ -645,8 +678,8 @@ class EssayCoherence:
                             elif data.get("type") == "critiques": # Assuming c1 critiques c2 is stored as rel[c2][c1] type="critiques"
                                 candidates.append((rel_concept, data.get("strength", 0) + 5))
                     if candidates:
-                        candidates.sort(key=lambda x: x[1], reverse=True)
-                        next_concept_in_dialectic = candidates[0][0]
+                        # Strongest candidate; max() keeps the first of any tie, as the stable sort did
+                        next_concept_in_dialectic = max(candidates, key=lambda x: x[1])[0]
                         found_antithesis = True
                 
                 if not found_antithesis:
@@ -699,8 +732,7 @@ class EssayCoherence:
                                 synthesis_candidates.append((rel_c, strength + 5, "elaboration"))
                 
                 if synthesis_candidates:
-                    synthesis_candidates.sort(key=lambda x: x[1], reverse=True) # Sort by strength
-                    next_concept_in_dialectic = synthesis_candidates[0][0]
+                    next_concept_in_dialectic = max(synthesis_candidates, key=lambda x: x[1])[0] # Strongest candidate
                 else:
                     # Fallback: get a concept generally related to the previous one
                     next_concept_in_dialectic = self.get_related_concept(previous_concept, exclude=excluded_from_progression)
@@ -742,7 +774,7 @@ class EssayCoherence:
         if specific_concept and specific_concept in self.concepts:
             primary_concept = specific_concept
             # Try to find a philosopher related to this specific concept
-            related_philosophers = [p for p, p_concepts in self.philosopher_concepts.items() if primary_concept in p_concepts]
+            related_philosophers = list(get_philosophers_by_concept(self.philosopher_concepts).get(primary_concept, ()))
             if related_philosophers:
                 primary_philosopher = random.choice(related_philosophers)
             else:
@@ -778,7 +810,10 @@ class EssayCoherence:
             exclude_philosophers = self.used_philosophers if avoid_recent else set()
             # Try to link philosopher to primary_concept if possible
             if primary_concept and primary_concept in self.philosopher_concepts:
-                candidates = [p for p, c_list in self.philosopher_concepts.items() if primary_concept in c_list and p not in exclude_philosophers]
+                candidates = [
+                    p for p in get_philosophers_by_concept(self.philosopher_concepts).get(primary_concept, ())
+                    if p not in exclude_philosophers
+                ]
                 if candidates:
                     primary_philosopher = random.choice(candidates)
                 else: # Fallback to general weighted philosopher
@@ -11,10 +11,9 @@ The citation system follows MLA 9 style guidelines.
 
 import random
 import metafiction
-from coherence import EssayCoherence
+from coherence import EssayCoherence, get_philosophers_by_concept
 from paragraph import generate_paragraph
 from json_data_provider import philosophers, concepts, terms, philosopher_concepts, thematic_clusters
-from reference import generate_reference
 from capitalization import (
     ensure_proper_capitalization_with_italics, 
     format_headings_with_title_case,
@@ -24,8 +23,9 @@ from capitalization import (
 from notes import NoteSystem
 from abstract_generator import generate_enhanced_abstract
 
+import io
 import re
-from collections import Counter
+from collections import deque
 
 # Define constants for sentence counts per paragraph
 MIN_SENTENCES_PER_PARAGRAPH = 7
@@ -33,6 +33,148 @@ MAX_SENTENCES_PER_PARAGRAPH = 10
 MIN_PARAGRAPHS_PER_SECTION = 2 # Define if not already defined
 MAX_PARAGRAPHS_PER_SECTION = 4 # Define if not already defined
 
+# Immutable snapshots of the vocabulary pools used for random fallbacks
+_CONCEPT_POOL = tuple(concepts)
+_TERM_POOL = tuple(terms)
+_PHILOSOPHER_POOL = tuple(philosophers)
+
+# Option pools for the word slots in generate_title's templates
+_TITLE_TOWARD_WORDS = ('Toward', 'Towards', 'Interrogating', 'Rethinking', 'Reimagining')
+_TITLE_POSITION_WORDS = ('Beyond', 'After', 'Against', 'Within', 'Between')
+_TITLE_CRITICAL_GERUNDS = ('Deconstructing', 'Problematizing', 'Negotiating', 'Tracing', 'Mapping')
+_TITLE_CONDITION_NOUNS = ('Impossibility', 'Possibility', 'Crisis', 'Politics', 'Poetics')
+_TITLE_AFTERMATH_NOUNS = ('Discontents', 'Others', 'Afterlives', 'Limits', 'Futures')
+_TITLE_DIRECTION_WORDS = ('Towards', 'Beyond', 'After', 'Against')
+_TITLE_PRACTICE_GERUNDS = ('Reading', 'Writing', 'Theorizing', 'Thinking', 'Performing')
+_TITLE_RELATION_WORDS = ('After', 'Through', 'Against', 'With', 'Beyond')
+_TITLE_FRAMING_PHRASES = ('The End of', 'After', 'Beyond', 'Against', 'Rethinking')
+
+# Title templates as builders taking (concept, term, secondary_concept, context),
+# so generate_title only draws word slots for the template it actually uses
+_TITLE_BUILDERS = (
+    lambda concept, term, secondary, context: f"The {context} of {concept}: {random.choice(_TITLE_TOWARD_WORDS)} {term}",
+    lambda concept, term, secondary, context: f"{concept} and {term}: {random.choice(_TITLE_POSITION_WORDS)} {secondary}",
+    lambda concept, term, secondary, context: f"{random.choice(_TITLE_CRITICAL_GERUNDS)} {concept}: {term} in {context}",
+    lambda concept, term, secondary, context: f"The {random.choice(_TITLE_CONDITION_NOUNS)} of {term}: {concept} and its {random.choice(_TITLE_AFTERMATH_NOUNS)}",
+    lambda concept, term, secondary, context: f"{concept}/{term}: {random.choice(_TITLE_DIRECTION_WORDS)} {context}",
+    lambda concept, term, secondary, context: f"{random.choice(_TITLE_PRACTICE_GERUNDS)} {concept} {random.choice(_TITLE_RELATION_WORDS)} {term}",
+    lambda concept, term, secondary, context: f"{random.choice(_TITLE_FRAMING_PHRASES)} {concept}: {term} and {secondary}",
+)
+
+_SECTION_TEMPLATES = (
+    "{concept1} and {term1}",
+    "{concept1} in {context1}",
+    "{philosopher1} on {concept1}",
+    "{concept1}, {term1}, and {context1}",
+    "{concept1} Beyond {term1}",
+    "The {context1} of {concept1}",
+)
+
+# Each section template paired with the placeholder names it uses
+_SECTION_TEMPLATE_SLOTS = tuple(
+    (template, frozenset(re.findall(r'\{(\w+)\}', template)))
+    for template in _SECTION_TEMPLATES
+)
+
+# Italics markers and quotes stripped before validating a candidate section title
+_SECTION_TITLE_MARKUP_PATTERN = re.compile(r'[*"]')
+
+class _TitleAutomaton:
+    """
+    Minimal Aho-Corasick automaton over casefolded concept and term literals.
+    Lets a title be scanned once for every vocabulary entry instead of running
+    one substring search per concept and per term.
+    """
+
+    def __init__(self, entries):
+        """Build the trie, failure links, and merged outputs from (literal, payload) pairs."""
+        self.goto = [{}]
+        self.outputs = [[]]
+        for literal, payload in entries:
+            state = 0
+            for char in literal:
+                next_state = self.goto[state].get(char)
+                if next_state is None:
+                    next_state = len(self.goto)
+                    self.goto[state][char] = next_state
+                    self.goto.append({})
+                    self.outputs.append([])
+                state = next_state
+            self.outputs[state].append(payload)
+
+        self.fail = [0] * len(self.goto)
+        queue = deque(self.goto[0].values())
+        while queue:
+            state = queue.popleft()
+            for char, next_state in self.goto[state].items():
+                queue.append(next_state)
+                fallback = self.fail[state]
+                while fallback and char not in self.goto[fallback]:
+                    fallback = self.fail[fallback]
+                self.fail[next_state] = self.goto[fallback].get(char, 0)
+                self.outputs[next_state] = self.outputs[next_state] + self.outputs[self.fail[next_state]]
+
+    def iter(self, text):
+        """Yield the payload of every literal occurring in text, overlaps included."""
+        goto, fail, outputs = self.goto, self.fail, self.outputs
+        state = 0
+        for char in text:
+            while state and char not in goto[state]:
+                state = fail[state]
+            state = goto[state].get(char, 0)
+            yield from outputs[state]
+
+_title_automata = {}
+
+def _get_title_automaton(concepts, terms):
+    """Return the cached automaton for this concept/term pair, building it on first use."""
+    key = (id(concepts), id(terms))
+    cached = _title_automata.get(key)
+    if cached is None or cached[0] is not concepts or cached[1] is not terms:
+        entries = [(concept.casefold(), ('primary_concepts', index, concept)) for index, concept in enumerate(concepts)]
+        entries.extend((term.casefold(), ('primary_terms', index, term)) for index, term in enumerate(terms))
+        cached = (concepts, terms, _TitleAutomaton(entries))
+        _title_automata[key] = cached
+    return cached[2]
+
+_explicit_title_theme_cache = {}
+_EXPLICIT_TITLE_THEME_CACHE_SIZE = 256
+
+def _get_explicit_title_themes(raw_title, concepts, terms):
+    """
+    Return the (concepts, terms) named in a title, memoized per title and vocabulary.
+    Only the deterministic matching is cached; random padding stays per call.
+    """
+    key = (raw_title, id(concepts), id(terms))
+    cached = _explicit_title_theme_cache.get(key)
+    if cached is not None and cached[0] is concepts and cached[1] is terms:
+        return cached[2]
+
+    found = {'primary_concepts': [], 'primary_terms': []}
+
+    # Find every concept or term explicitly mentioned in the title. A single
+    # automaton pass finds every literal; hits are then emitted in vocabulary
+    # order so the result matches a per-item substring scan. Title template
+    # patterns ("X and Y: ...", "... of X") are not swept separately: any
+    # capture that names a known concept or term is itself a literal
+    # occurrence, so the automaton has already found it.
+    explicit_hits = {}
+    for kind, index, canonical in _get_title_automaton(concepts, terms).iter(raw_title.casefold()):
+        explicit_hits[(kind, index)] = canonical
+    for (kind, _), canonical in sorted(explicit_hits.items()):
+        found[kind].append(canonical)
+
+    primary_concepts = tuple(dict.fromkeys(found['primary_concepts']))
+    primary_terms = tuple(
+        term for term in dict.fromkeys(found['primary_terms'])
+        if term not in primary_concepts
+    )
+
+    if len(_explicit_title_theme_cache) >= _EXPLICIT_TITLE_THEME_CACHE_SIZE:
+        _explicit_title_theme_cache.clear()
+    _explicit_title_theme_cache[key] = (concepts, terms, (primary_concepts, primary_terms))
+    return primary_concepts, primary_terms
+
 def extract_themes_from_title(raw_title, concepts, terms, coherence_manager=None):
     """
     Extract key concepts and terms from the title for thematic consistency.
@@ -43,75 +185,17 @@ def extract_themes_from_title(raw_title, concepts, terms, coherence_manager=None
         terms (list): Available terms list
         
     Returns:
-        dict: Dictionary of title themes (concepts, terms, related concepts)
+        dict: Dictionary of title themes (concepts, terms, related concepts, and their combination)
     """
-    # Initialize dictionary to store themes
+    explicit_concepts, explicit_terms = _get_explicit_title_themes(raw_title, concepts, terms)
+
+    # Fresh lists every call, so callers can extend them without touching the cache
     title_themes = {
-        'primary_concepts': [],
-        'primary_terms': [],
+        'primary_concepts': list(explicit_concepts),
+        'primary_terms': list(explicit_terms),
         'related_concepts': []
     }
     
-    # First, try to find any concepts or terms explicitly mentioned in the title
-    for concept in concepts:
-        if concept.lower() in raw_title.lower():
-            title_themes['primary_concepts'].append(concept)
-    
-    for term in terms:
-        if term.lower() in raw_title.lower():
-            title_themes['primary_terms'].append(term)
-    
-    # Try pattern matching if explicit matches are insufficient
-    if len(title_themes['primary_concepts']) < 2:
-        # Common patterns in title templates - updated to capture multi-word concepts
-        concept_patterns = [
-            r'of ([\w\s-]+?)(?::|,| and| in|$)',  # captures concepts after 'of '
-            r'([\w\s-]+?)(?: and|:) ', # captures concepts before ' and ' or ':'
-            r'^([\w\s-]+?)(?::|,)', # captures concepts at the beginning of the title, before ':' or ','
-            r'([\w\s-]+?):' # captures concepts followed by a colon
-        ]
-        
-        # Try each pattern
-        for pattern in concept_patterns:
-            matches = re.findall(pattern, raw_title)
-            if matches:
-                for match in matches:
-                    if isinstance(match, tuple):
-                        for group in match:
-                            if group and any(concept.lower() == group.lower() for concept in concepts):
-                                matching_concept = next(c for c in concepts if c.lower() == group.lower())
-                                title_themes['primary_concepts'].append(matching_concept)
-                    elif isinstance(match, str) and any(concept.lower() == match.lower() for concept in concepts):
-                        matching_concept = next(c for c in concepts if c.lower() == match.lower())
-                        title_themes['primary_concepts'].append(matching_concept)
-    
-    # Similar approach for terms
-    if len(title_themes['primary_terms']) < 2:
-        term_patterns = [
-            r': ([\w\s-]+?)(?: in|$)', # captures terms after ': '
-            r'([\w\s-]+?) in the', # captures terms before ' in the'
-            r'([\w\s-]+?):' # captures terms before ':'
-        ]
-        
-        for pattern in term_patterns:
-            matches = re.findall(pattern, raw_title)
-            if matches:
-                for match in matches:
-                    if isinstance(match, tuple):
-                        for group in match:
-                            if group and any(term.lower() == group.lower() for term in terms):
-                                matching_term = next(t for t in terms if t.lower() == group.lower())
-                                title_themes['primary_terms'].append(matching_term)
-                    elif isinstance(match, str) and any(term.lower() == match.lower() for term in terms):
-                        matching_term = next(t for t in terms if t.lower() == match.lower())
-                        title_themes['primary_terms'].append(matching_term)
-
-    title_themes['primary_concepts'] = list(dict.fromkeys(title_themes['primary_concepts']))
-    title_themes['primary_terms'] = [
-        term for term in dict.fromkeys(title_themes['primary_terms'])
-        if term not in title_themes['primary_concepts']
-    ]
-    
     # If we still don't have enough themes, add some random ones
     # but with less weight than the ones directly from the title
     if len(title_themes['primary_concepts']) < 2:
@@ -149,15 +233,22 @@ def extract_themes_from_title(raw_title, concepts, terms, coherence_manager=None
         )
     
     # Deduplicate
-    title_themes['primary_concepts'] = list(set(title_themes['primary_concepts']))
-    title_themes['primary_terms'] = list(set(title_themes['primary_terms']))
-    title_themes['related_concepts'] = list(set(title_themes['related_concepts']))
+    title_themes['primary_concepts'] = list(dict.fromkeys(title_themes['primary_concepts']))
+    title_themes['primary_terms'] = list(dict.fromkeys(title_themes['primary_terms']))
+    title_themes['related_concepts'] = list(dict.fromkeys(title_themes['related_concepts']))
+    # Concatenated once here for the section and sentence paths that consult both lists
+    title_themes['combined_concepts'] = title_themes['primary_concepts'] + title_themes['related_concepts']
     
     return title_themes
 
+_relevant_philosopher_cache = {}
+_RELEVANT_PHILOSOPHER_CACHE_SIZE = 512
+
 def find_relevant_philosophers(concepts, terms, philosopher_concepts):
     """
     Find philosophers most associated with given concepts and terms.
+    Results are memoized per concept set and philosopher_concepts mapping;
+    terms do not currently influence the match and are not part of the key.
     
     Args:
         concepts (list): List of concepts to match
@@ -167,19 +258,30 @@ def find_relevant_philosophers(concepts, terms, philosopher_concepts):
     Returns:
         list: Philosophers most relevant to the given concepts and terms
     """
-    relevant_philosophers = []
+    key = (frozenset(concepts), id(philosopher_concepts))
+    cached = _relevant_philosopher_cache.get(key)
+    if cached is not None and cached[0] is philosopher_concepts:
+        return list(cached[1])
+
+    philosophers_by_concept = get_philosophers_by_concept(philosopher_concepts)
+    relevant_philosophers = set()
     
     # Find philosophers associated with concepts
     for concept in concepts:
-        for philosopher, philo_concepts in philosopher_concepts.items():
-            if concept in philo_concepts:
-                relevant_philosophers.append(philosopher)
-    
-    # If we found relevant philosophers, return them, otherwise return empty list
-    if relevant_philosophers:
-        return list(set(relevant_philosophers))  # Deduplicate
-    else:
-        return []
+        relevant_philosophers.update(philosophers_by_concept.get(concept, ()))
+    
+    # Emit matches in philosopher_concepts order rather than set order, so the
+    # result (and any random choice made from it) does not depend on string
+    # hashing. An empty tuple means no relevant philosophers were found.
+    result = tuple(
+        philosopher for philosopher in philosopher_concepts
+        if philosopher in relevant_philosophers
+    )
+
+    if len(_relevant_philosopher_cache) >= _RELEVANT_PHILOSOPHER_CACHE_SIZE:
+        _relevant_philosopher_cache.clear()
+    _relevant_philosopher_cache[key] = (philosopher_concepts, result)
+    return list(result)
 
 def generate_title(coherence_manager):
     """
@@ -230,18 +332,9 @@ def generate_title(coherence_manager):
 
     title_context = coherence_manager.get_theme_title_context_label() or primary_term
 
-    # More sophisticated title templates
-    title_templates = [
-        f"The {title_context} of {primary_concept}: {random.choice(['Toward', 'Towards', 'Interrogating', 'Rethinking', 'Reimagining'])} {primary_term}",
-        f"{primary_concept} and {primary_term}: {random.choice(['Beyond', 'After', 'Against', 'Within', 'Between'])} {secondary_concept}",
-        f"{random.choice(['Deconstructing', 'Problematizing', 'Negotiating', 'Tracing', 'Mapping'])} {primary_concept}: {primary_term} in {title_context}",
-        f"The {random.choice(['Impossibility', 'Possibility', 'Crisis', 'Politics', 'Poetics'])} of {primary_term}: {primary_concept} and its {random.choice(['Discontents', 'Others', 'Afterlives', 'Limits', 'Futures'])}",
-        f"{primary_concept}/{primary_term}: {random.choice(['Towards', 'Beyond', 'After', 'Against'])} {title_context}",
-        f"{random.choice(['Reading', 'Writing', 'Theorizing', 'Thinking', 'Performing'])} {primary_concept} {random.choice(['After', 'Through', 'Against', 'With', 'Beyond'])} {primary_term}",
-        f"{random.choice(['The End of', 'After', 'Beyond', 'Against', 'Rethinking'])} {primary_concept}: {primary_term} and {secondary_concept}"
-    ]
-    
-    raw_title = random.choice(title_templates)
+    # More sophisticated title templates; only the chosen one is built
+    build_title = random.choice(_TITLE_BUILDERS)
+    raw_title = build_title(primary_concept, primary_term, secondary_concept, title_context)
     
     # Record usage of concepts and terms in the title
     coherence_manager.record_usage(
@@ -260,14 +353,14 @@ def generate_essay(theme_key=None, metafiction_level='moderate'):
     note_system = NoteSystem(coherence_manager=coherence_manager)
     note_system.reset() # Reset note system state
     
-    essay_parts = []
+    essay_buffer = io.StringIO()
     used_quotes = set() # Initialize used_quotes here
 
     # Title with greater sophistication
     raw_title = generate_title(coherence_manager)
     # Apply title case without running through the regular capitalization system
     title = apply_title_case(raw_title)
-    essay_parts.append(f"# {title}\n\n")
+    essay_buffer.write(f"# {title}\n\n")
     
     # Extract the main themes from the title for consistent usage
     title_themes = extract_themes_from_title(raw_title, concepts, terms, coherence_manager=coherence_manager)
@@ -277,13 +370,13 @@ def generate_essay(theme_key=None, metafiction_level='moderate'):
     
     # Find philosophers most associated with title themes
     relevant_philosophers = find_relevant_philosophers(
-        title_themes['primary_concepts'] + title_themes['related_concepts'],
+        title_themes['combined_concepts'],
         title_themes['primary_terms'],
         philosopher_concepts
     )
     # Ensure relevant_philosophers is not empty, if so, pick some random ones
     if not relevant_philosophers:
-        relevant_philosophers = random.sample(philosophers, min(3, len(philosophers)))
+        relevant_philosophers = random.sample(_PHILOSOPHER_POOL, min(3, len(_PHILOSOPHER_POOL)))
     
     # Generate a more comprehensive abstract with keywords that reference title themes
     abstract = generate_enhanced_abstract(coherence_manager, title_themes, essay_theme_key=theme_key)
@@ -294,8 +387,8 @@ def generate_essay(theme_key=None, metafiction_level='moderate'):
     # Apply italicization to terms
     abstract = italicize_terms_in_text(abstract)
     
-    essay_parts.append(abstract) # Removed unnecessary extra '\n'
-    essay_parts.append("## Introduction\n\n") # Then "## Introduction" followed by two newlines (for a blank line)
+    essay_buffer.write(abstract) # Removed unnecessary extra '\n'
+    essay_buffer.write("## Introduction\n\n") # Then "## Introduction" followed by two newlines (for a blank line)
 
     # Body sections with dialectical development - determine count early for intro context
     num_body_sections = random.randint(3, 5)
@@ -305,14 +398,22 @@ def generate_essay(theme_key=None, metafiction_level='moderate'):
                        else coherence_manager.get_surface_concept()
                        if coherence_manager
                        else coherence_manager.primary_concepts[0] if coherence_manager.primary_concepts 
-                       else random.choice(concepts))
+                       else random.choice(_CONCEPT_POOL))
     
+    # Bind the per-paragraph helpers to locals for the introduction, body and conclusion loops
+    _randint = random.randint
+    _generate_paragraph = generate_paragraph
+    _record_usage = coherence_manager.record_usage
+    _get_mentioned_philosophers = note_system.get_mentioned_philosophers
+    _detect_dialectical_moment = coherence_manager.detect_dialectical_moment
+    _insert_metafiction = metafiction.insert_metafiction_in_paragraph
+
     # Generate Introduction section
-    num_intro_paragraphs = random.randint(1, 2)  # Usually 1-2 paragraphs for introduction
+    num_intro_paragraphs = _randint(1, 2)  # Usually 1-2 paragraphs for introduction
     coherence_manager.advance_section()  # Track introduction section
     
     for intro_index in range(num_intro_paragraphs):
-        num_sentences = random.randint(MIN_SENTENCES_PER_PARAGRAPH - 2, MAX_SENTENCES_PER_PARAGRAPH - 1)
+        num_sentences = _randint(MIN_SENTENCES_PER_PARAGRAPH - 2, MAX_SENTENCES_PER_PARAGRAPH - 1)
         if num_sentences < 4: num_sentences = 4  # Ensure introduction is substantial
         
         # Introduction context includes overall essay themes and relevant philosophers
@@ -328,22 +429,22 @@ def generate_essay(theme_key=None, metafiction_level='moderate'):
             'paragraph_id': f"introduction-{intro_index}"
         }
         
-        intro_paragraph, intro_concepts, intro_philosophers = generate_paragraph(
+        intro_paragraph, intro_concepts, intro_philosophers = _generate_paragraph(
             template_type='introduction',  # Use introduction template type
             num_sentences=num_sentences,
-            mentioned_philosophers=note_system.get_mentioned_philosophers(),
+            mentioned_philosophers=_get_mentioned_philosophers(),
             used_quotes=used_quotes,
             note_system=note_system,
             context=intro_context,
             coherence_manager=coherence_manager
         )
-        essay_parts.append(intro_paragraph + "\n\n")
+        essay_buffer.write(intro_paragraph + "\n\n")
         
         # Record usage for introduction elements
         if intro_concepts:
-            coherence_manager.record_usage(concepts=intro_concepts)
+            _record_usage(concepts=intro_concepts)
         if intro_philosophers:
-            coherence_manager.record_usage(philosophers=intro_philosophers)
+            _record_usage(philosophers=intro_philosophers)
     
     # Generate the sequence of concepts for body sections using the advanced dialectic
     section_concepts = coherence_manager.develop_dialectic(starting_concept, num_steps=num_body_sections)
@@ -352,25 +453,35 @@ def generate_essay(theme_key=None, metafiction_level='moderate'):
     # This is a safeguard in case develop_dialectic returns fewer than num_body_sections.
     if len(section_concepts) < num_body_sections:
         needed = num_body_sections - len(section_concepts)
+        # Track the progression as a set once instead of rebuilding it per draw
+        used_section_concepts = set(section_concepts)
         for _ in range(needed):
             # Exclude concepts already in the progression to ensure variety
-            fallback_concept = coherence_manager.get_surface_concept(exclude=set(section_concepts))
-            if fallback_concept:
-                section_concepts.append(fallback_concept)
-            else:
+            fallback_concept = coherence_manager.get_surface_concept(exclude=used_section_concepts)
+            if not fallback_concept:
                 # If still no fallback, pick any concept not already used (very rare)
-                available_fallbacks = [c for c in concepts if c not in section_concepts]
+                available_fallbacks = [c for c in _CONCEPT_POOL if c not in used_section_concepts]
                 if available_fallbacks:
-                    section_concepts.append(random.choice(available_fallbacks))
+                    fallback_concept = random.choice(available_fallbacks)
                 else: # Absolute last resort, repeat last concept (should almost never happen)
-                    section_concepts.append(section_concepts[-1] if section_concepts else random.choice(concepts))
+                    fallback_concept = section_concepts[-1] if section_concepts else random.choice(_CONCEPT_POOL)
+            section_concepts.append(fallback_concept)
+            used_section_concepts.add(fallback_concept)
+
+    # Other section themes stay forbidden for every paragraph of a section; build each
+    # section's read-only exclusion tuple once, before any paragraphs are generated
+    forbidden_concepts_per_section = [
+        tuple(c for c in section_concepts if c != section_theme)
+        for section_theme in section_concepts[:num_body_sections]
+    ]
 
     section_counter = 0
     for i in range(num_body_sections):
         section_theme_concept = section_concepts[i]
+        section_forbidden_concepts = forbidden_concepts_per_section[i]
         section_counter += 1
         section_paragraphs = []
-        num_paragraphs_in_section = random.randint(MIN_PARAGRAPHS_PER_SECTION, MAX_PARAGRAPHS_PER_SECTION)
+        num_paragraphs_in_section = _randint(MIN_PARAGRAPHS_PER_SECTION, MAX_PARAGRAPHS_PER_SECTION)
         
         # Advance section tracking in coherence manager
         coherence_manager.advance_section()
@@ -392,19 +503,19 @@ def generate_essay(theme_key=None, metafiction_level='moderate'):
         }
 
         for j in range(num_paragraphs_in_section):
-            num_sentences = random.randint(MIN_SENTENCES_PER_PARAGRAPH, MAX_SENTENCES_PER_PARAGRAPH)
+            num_sentences = _randint(MIN_SENTENCES_PER_PARAGRAPH, MAX_SENTENCES_PER_PARAGRAPH)
             paragraph_context = section_context.copy()
             paragraph_context['paragraph_id'] = f"section-{i + 1}-paragraph-{j}"
             paragraph_context['force_theme_local'] = (j == 0)
             if j == 0:
                 paragraph_context['theme_term'] = coherence_manager.get_surface_term(exclude={section_theme_concept})
             # Pass coherence_manager and section_context to paragraph generation
-            paragraph_text, paragraph_concepts, paragraph_philosophers = generate_paragraph(
+            paragraph_text, paragraph_concepts, paragraph_philosophers = _generate_paragraph(
                 template_type='general', 
                 num_sentences=num_sentences, 
                 forbidden_philosophers=[], # Manage forbidden items at a higher level or within paragraph if needed
-                forbidden_concepts=[c for c in section_concepts if c != section_theme_concept], # Avoid other section themes strongly
-                mentioned_philosophers=note_system.get_mentioned_philosophers(),
+                forbidden_concepts=section_forbidden_concepts, # Avoid other section themes strongly
+                mentioned_philosophers=_get_mentioned_philosophers(),
                 used_quotes=used_quotes, # Pass used_quotes
                 note_system=note_system,
                 context=paragraph_context, # Pass section-specific context
@@ -414,12 +525,12 @@ def generate_essay(theme_key=None, metafiction_level='moderate'):
             
             # Record usage of concepts and philosophers from the paragraph for weight adjustment
             if paragraph_concepts:
-                coherence_manager.record_usage(concepts=paragraph_concepts)
+                _record_usage(concepts=paragraph_concepts)
                 # Detect dialectical moments for each concept used
                 for concept in paragraph_concepts:
-                    coherence_manager.detect_dialectical_moment(concept, paragraph_text)
+                    _detect_dialectical_moment(concept, paragraph_text)
             if paragraph_philosophers:
-                coherence_manager.record_usage(philosophers=paragraph_philosophers)
+                _record_usage(philosophers=paragraph_philosophers)
             
             # Enhanced metafictional element insertion with contextual awareness
             dialectical_context = coherence_manager.get_dialectical_context()
@@ -429,7 +540,7 @@ def generate_essay(theme_key=None, metafiction_level='moderate'):
                 'metafiction_count_this_section': coherence_manager.metafiction_count_per_section[coherence_manager.section_index]
             }
             
-            meta_text = metafiction.insert_metafiction_in_paragraph(
+            meta_text = _insert_metafiction(
                 section_paragraphs[-1], 
                 theme_key=theme_key, 
                 coherence_manager=coherence_manager,
@@ -443,15 +554,17 @@ def generate_essay(theme_key=None, metafiction_level='moderate'):
 
         # Generate section title based on content and section theme
         section_title_text = generate_section_title(section_paragraphs, coherence_manager, section_theme_concept, title_themes)
-        essay_parts.append(f"## {section_title_text}\n\n")
-        essay_parts.extend([p + "\n\n" for p in section_paragraphs])
+        essay_buffer.write(f"## {section_title_text}\n\n")
+        essay_buffer.write("\n\n".join(section_paragraphs))
+        essay_buffer.write("\n\n")
 
     # Conclusion
-    essay_parts.append("## Conclusion\n\n")
+    essay_buffer.write("## Conclusion\n\n")
     coherence_manager.advance_section()  # Track conclusion section
-    num_conclusion_paragraphs = random.randint(1, MAX_PARAGRAPHS_PER_SECTION -1) # Typically 1-2 paragraphs
+    num_conclusion_paragraphs = _randint(1, MAX_PARAGRAPHS_PER_SECTION -1) # Typically 1-2 paragraphs
+    conclusion_paragraphs = []
     for conclusion_index in range(num_conclusion_paragraphs):
-        num_sentences = random.randint(MIN_SENTENCES_PER_PARAGRAPH -1, MAX_SENTENCES_PER_PARAGRAPH -1)
+        num_sentences = _randint(MIN_SENTENCES_PER_PARAGRAPH -1, MAX_SENTENCES_PER_PARAGRAPH -1)
         if num_sentences < 3: num_sentences = 3 # Ensure conclusion is not too short
         
         # Conclusion context can be simpler or refer to overall themes
@@ -465,26 +578,31 @@ def generate_essay(theme_key=None, metafiction_level='moderate'):
             'paragraph_id': f"conclusion-{conclusion_index}"
         }
         
-        conclusion_paragraph, conclusion_concepts, conclusion_philosophers = generate_paragraph(
+        conclusion_paragraph, conclusion_concepts, conclusion_philosophers = _generate_paragraph(
             template_type='conclusion', 
             num_sentences=num_sentences, 
-            mentioned_philosophers=note_system.get_mentioned_philosophers(),
+            mentioned_philosophers=_get_mentioned_philosophers(),
             used_quotes=used_quotes, # Pass used_quotes
             note_system=note_system,
             context=conclusion_context,
             coherence_manager=coherence_manager
         )
-        essay_parts.append(conclusion_paragraph + "\n\n")
+        conclusion_paragraphs.append(conclusion_paragraph)
         
         # Record usage for conclusion elements too
         if conclusion_concepts:
-            coherence_manager.record_usage(concepts=conclusion_concepts)
+            _record_usage(concepts=conclusion_concepts)
         if conclusion_philosophers:
-            coherence_manager.record_usage(philosophers=conclusion_philosophers)
+            _record_usage(philosophers=conclusion_philosophers)
     
     # Add a final metafictional statement to the conclusion if desired
     # Store the last conclusion paragraph without trailing newlines for potential concatenation
-    last_conclusion_paragraph = essay_parts.pop().rstrip() if essay_parts and essay_parts[-1].endswith("\n\n") else ""
+    # Hold the last conclusion paragraph back from the buffer so the final
+    # metafictional statement can still be appended to it
+    if len(conclusion_paragraphs) > 1:
+        essay_buffer.write("\n\n".join(conclusion_paragraphs[:-1]))
+        essay_buffer.write("\n\n")
+    last_conclusion_paragraph = conclusion_paragraphs[-1].rstrip() if conclusion_paragraphs else ""
     
     if num_conclusion_paragraphs > 0: # Ensure there was a conclusion paragraph to begin with
         current_conclusion_content = last_conclusion_paragraph
@@ -542,84 +660,17 @@ def generate_essay(theme_key=None, metafiction_level='moderate'):
             current_conclusion_content = processed_final_meta
 
     if current_conclusion_content: # Only append if there's something to append
-        essay_parts.append(current_conclusion_content + "\n\n")
+        essay_buffer.write(current_conclusion_content + "\n\n")
 
     # Works Cited / Bibliography
     notes_and_bibliography_section = note_system.generate_notes_section()
     if notes_and_bibliography_section:
-        essay_parts.append(notes_and_bibliography_section)
-    
-    return "".join(essay_parts)
-
-def generate_section_title(section_paragraphs, coherence_manager, section_theme_concept, title_themes=None):
-    """
-    Generate a sophisticated, context-aware section title using a template.
-    Ensures the title is relevant to the section's content and overall essay themes.
-    """
-    templates = [
-        "{concept1} and {term1}",
-        "{concept1} in {context1}",
-        "{philosopher1} on {concept1}",
-        "{concept1}, {term1}, and {context1}",
-        "{concept1} Beyond {term1}",
-        "The {context1} of {concept1}"
-    ]
-    
-    # section_theme_concept is the primary concept for this section's title
-    primary_concept = section_theme_concept
+        essay_buffer.write(notes_and_bibliography_section)
     
-    # Get a primary term related to the primary_concept or from coherence_manager
-    if coherence_manager:
-        primary_term = (
-            coherence_manager.get_surface_term(exclude={primary_concept}, fallback_to_general=False)
-            or coherence_manager.get_surface_term(exclude={primary_concept})
-            or coherence_manager.get_weighted_term(exclude={primary_concept})
-        )
-    else:
-        primary_term = random.choice([t for t in terms if t != primary_concept] or terms)
-
-    if not primary_term: # Absolute fallback if term selection failed
-        primary_term = random.choice([t for t in terms if t != primary_concept] or terms)
-
-    # Get other concepts and terms, trying to use title_themes for relevance if available
-    secondary_concept_candidates = []
-    if title_themes:
-        secondary_concept_candidates.extend(title_themes.get('primary_concepts', []))
-        secondary_concept_candidates.extend(title_themes.get('related_concepts', []))
-    if coherence_manager and coherence_manager.active_theme_key:
-        secondary_concept_candidates.extend(coherence_manager.active_theme_data.get('key_concepts', []))
-    # Filter out the primary_concept from candidates
-    secondary_concept_candidates = [c for c in secondary_concept_candidates if c != primary_concept]
-    if not secondary_concept_candidates: # Fallback if title_themes didn't provide suitable candidates
-        if coherence_manager and coherence_manager.active_theme_key:
-            secondary_concept_candidates = [
-                c for c in coherence_manager.active_theme_data.get('key_concepts', [])
-                if c != primary_concept
-            ]
-        if not secondary_concept_candidates:
-            secondary_concept_candidates = [c for c in concepts if c != primary_concept]
-    
-    secondary_concept = random.choice(secondary_concept_candidates if secondary_concept_candidates else concepts) # Final fallback to all concepts
-
-    secondary_term_candidates = []
-    if title_themes:
-        secondary_term_candidates.extend(title_themes.get('primary_terms', []))
-    if coherence_manager and coherence_manager.active_theme_key:
-        secondary_term_candidates.extend(coherence_manager.active_theme_data.get('relevant_terms', []))
-    # Filter out the primary_term and concepts used as terms
-    secondary_term_candidates = [t for t in secondary_term_candidates if t != primary_term and t != primary_concept and t != secondary_concept]
-    if not secondary_term_candidates: # Fallback
-        if coherence_manager and coherence_manager.active_theme_key:
-            secondary_term_candidates = [
-                t for t in coherence_manager.active_theme_data.get('relevant_terms', [])
-                if t != primary_term and t != primary_concept and t != secondary_concept
-            ]
-        if not secondary_term_candidates:
-            secondary_term_candidates = [t for t in terms if t != primary_term and t != primary_concept and t != secondary_concept]
+    return essay_buffer.getvalue()
 
-    secondary_term = random.choice(secondary_term_candidates if secondary_term_candidates else terms) # Final fallback to all terms
-        
-    # Select a relevant philosopher
+def _select_section_philosopher(primary_concept, primary_term, coherence_manager, title_themes=None):
+    """Pick the philosopher for a section title, preferring theme-local figures tied to its concept."""
     # Prefer philosophers linked to the primary concept of the section, or from title_themes
     relevant_philosophers_for_section = find_relevant_philosophers([primary_concept], [primary_term], philosopher_concepts)
     if coherence_manager and coherence_manager.active_theme_key:
@@ -632,7 +683,9 @@ def generate_section_title(section_paragraphs, coherence_manager, section_theme_
             relevant_philosophers_for_section = theme_relevant_philosophers
     if not relevant_philosophers_for_section and title_themes:
         relevant_philosophers_for_section = find_relevant_philosophers(
-            title_themes.get('primary_concepts', []) + title_themes.get('related_concepts', []),
+            # Callers may pass title_themes without the combined_concepts key
+            title_themes.get('combined_concepts')
+            or title_themes.get('primary_concepts', []) + title_themes.get('related_concepts', []),
             title_themes.get('primary_terms', []),
             philosopher_concepts
         )
@@ -645,36 +698,61 @@ def generate_section_title(section_paragraphs, coherence_manager, section_theme_
             if theme_relevant_philosophers:
                 relevant_philosophers_for_section = theme_relevant_philosophers
 
-    philosopher = (
+    return (
         random.choice(relevant_philosophers_for_section)
         if relevant_philosophers_for_section
         else coherence_manager.get_surface_philosopher() if coherence_manager
-        else random.choice(philosophers)
+        else random.choice(_PHILOSOPHER_POOL)
     )
 
+def generate_section_title(section_paragraphs, coherence_manager, section_theme_concept, title_themes=None):
+    """
+    Generate a sophisticated, context-aware section title using a template.
+    Ensures the title is relevant to the section's content and overall essay themes.
+    """
+    # section_theme_concept is the primary concept for this section's title
+    primary_concept = section_theme_concept
+    
+    # Get a primary term related to the primary_concept or from coherence_manager
+    if coherence_manager:
+        primary_term = (
+            coherence_manager.get_surface_term(exclude={primary_concept}, fallback_to_general=False)
+            or coherence_manager.get_surface_term(exclude={primary_concept})
+            or coherence_manager.get_weighted_term(exclude={primary_concept})
+        )
+    else:
+        primary_term = random.choice([t for t in _TERM_POOL if t != primary_concept] or _TERM_POOL)
+
+    if not primary_term: # Absolute fallback if term selection failed
+        primary_term = random.choice([t for t in _TERM_POOL if t != primary_concept] or _TERM_POOL)
+
     context_word = coherence_manager.get_theme_title_context_label() if coherence_manager else None
     if not context_word:
         context_word = "theory"
 
     invalid_contexts = [phrase.lower() for phrase in coherence_manager.active_theme_data.get('context_phrases', [])] if coherence_manager and coherence_manager.active_theme_data else []
 
+    # Templates are picked before their slots are filled, so the philosopher
+    # is only looked up if a chosen template actually names one
+    philosopher = None
     for _ in range(5):
-        template = random.choice(templates)
+        template, slots = random.choice(_SECTION_TEMPLATE_SLOTS)
+        if philosopher is None and 'philosopher1' in slots:
+            philosopher = _select_section_philosopher(primary_concept, primary_term, coherence_manager, title_themes)
         raw_section_title = template.format(
             concept1=primary_concept,
-            concept2=secondary_concept,
             term1=primary_term,
-            term2=secondary_term,
             philosopher1=philosopher,
             context1=context_word
         )
         section_title = italicize_terms_in_text(apply_title_case(raw_section_title))
-        cleaned_title = re.sub(r'[*"]', '', section_title)
+        cleaned_title = _SECTION_TITLE_MARKUP_PATTERN.sub('', section_title)
         if len(cleaned_title.split()) > 16:
             continue
         if "(" in cleaned_title or ")" in cleaned_title:
             continue
-        if any(phrase and phrase in cleaned_title.lower() for phrase in invalid_contexts):
+        cleaned_title_lower = cleaned_title.lower()
+        if any(phrase and phrase in cleaned_title_lower for phrase in invalid_contexts):
             continue
         return section_title
 
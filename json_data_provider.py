@@ -6,6 +6,7 @@ It also provides default data if the JSON file is not found or corrupt.
 
 import json
 import os
+import sys
 
 # Determine the absolute path to data.json dynamically
 # __file__ is the path to the current script (json_data_provider.py)
@@ -150,4 +151,17 @@ if concept_relation_details is None: # Added check for new variable
     concept_relation_details = []
 # Add more checks like this for other critical variables if necessary
 
+def _intern_strings(values):
+    """Intern the string entries of a vocabulary list in place, leaving other entries untouched."""
+    if not isinstance(values, list):
+        return
+    for index, value in enumerate(values):
+        if isinstance(value, str):
+            values[index] = sys.intern(value)
+
+# The core vocabularies are compared and looked up in sets throughout generation; interning
+# them lets equal entries share one object, so those comparisons short-circuit on identity
+for _vocabulary in (philosophers, concepts, terms, adjectives):
+    _intern_strings(_vocabulary)
+
 # print("json_data_provider.py loaded and data (or defaults) are set.") # Optional: for debugging 
@@ -5,7 +5,6 @@ It uses the `essay` module to create the essay content and includes
 academic citation conventions.
 """
 
-from essay import generate_essay
 from json_data_provider import thematic_clusters # Import thematic_clusters to list available themes
 from md_export import export_to_markdown # Import the new export function
 import sys
@@ -17,14 +16,42 @@ import re
 from textwrap import dedent
 
 
+# Canonical CLI ordering of theme keys, computed once; the set backs validity checks
+_AVAILABLE_THEMES = tuple(sorted(thematic_clusters.keys(), key=str.casefold))
+_AVAILABLE_THEME_SET = frozenset(_AVAILABLE_THEMES)
+
+
 def get_available_themes():
     """Return the canonical CLI ordering for theme keys."""
-    return sorted(thematic_clusters.keys(), key=str.casefold)
+    return list(_AVAILABLE_THEMES)
+
+
+# Fixed interactive screen text, each printed with a single call
+_INTERACTIVE_BANNER = (
+    "=== Postmodern Essay Generator ===\n"
+    "Tip: Use 'python main.py --help' or 'python main.py --list-themes' for the non-interactive interface.\n"
+)
+_NAVIGATION_OPTIONS = (
+    "Navigation Options:\n"
+    "  s. Change seed\n"
+    "  m. Change metafiction level\n"
+    "  i. Theme information\n"
+    "  h. CLI help"
+)
+
+# Formatted listings keyed by (themes, include_descriptions, numbered); the theme data is fixed
+# for the process, so the information screen is built once however often it is reopened
+_theme_listing_cache = {}
 
 
 def format_theme_listing(available_themes=None, include_descriptions=False, numbered=False):
     """Format available themes for CLI or interactive display."""
-    themes = available_themes or get_available_themes()
+    themes = tuple(available_themes or _AVAILABLE_THEMES)
+    cache_key = (themes, include_descriptions, numbered)
+    cached = _theme_listing_cache.get(cache_key)
+    if cached is not None:
+        return cached
+
     lines = []
     for index, theme_key in enumerate(themes, start=1):
         prefix = f"{index}. " if numbered else "- "
@@ -32,7 +59,9 @@ def format_theme_listing(available_themes=None, include_descriptions=False, numb
         if include_descriptions:
             description = thematic_clusters.get(theme_key, {}).get('description', 'No description available.')
             lines.append(f"   {description}")
-    return "\n".join(lines)
+    listing = "\n".join(lines)
+    _theme_listing_cache[cache_key] = listing
+    return listing
 
 
 def build_parser():
@@ -54,6 +83,7 @@ def build_parser():
           --export writes to essays/
           --output <filename> implies --export and writes inside essays/
           --no-export skips export entirely
+          --quiet skips printing the essay to the terminal
 
         Examples:
           python main.py --help
@@ -104,6 +134,11 @@ def build_parser():
         type=str,
         help="Filename only for Markdown export inside essays/. Implies --export.",
     )
+    parser.add_argument(
+        "--quiet",
+        action="store_true",
+        help="Do not print the generated essay to the terminal (useful with --export).",
+    )
     return parser
 
 
@@ -121,6 +156,20 @@ def validate_output_filename_argument(parser, output_filename):
 
     return candidate
 
+# ANSI "erase display" followed by "cursor home"
+_CLEAR_SCREEN_SEQUENCE = "\x1b[2J\x1b[H"
+
+
+def clear_screen():
+    """Clear the terminal before redrawing an interactive menu."""
+    if os.name == 'nt':
+        # Older Windows consoles do not interpret ANSI escapes
+        os.system('cls')
+        return
+    # Writing the escape sequence avoids spawning a shell and /usr/bin/clear per redraw
+    sys.stdout.write(_CLEAR_SCREEN_SEQUENCE)
+    sys.stdout.flush()
+
 def get_user_seed():
     """Prompt the user to enter a seed or choose random generation."""
     while True:
@@ -135,7 +184,7 @@ def get_user_seed():
 
 def show_theme_info(available_themes):
     """Displays detailed information about each available theme."""
-    os.system('cls' if os.name == 'nt' else 'clear')
+    clear_screen()
     print("--- Theme Information ---")
     if not available_themes:
         print("No themes available to display information for.")
@@ -187,9 +236,7 @@ def get_metafiction_level():
 
 def interactive_setup():
     """Handle the complete interactive setup flow with navigation options."""
-    print("=== Postmodern Essay Generator ===")
-    print("Tip: Use 'python main.py --help' or 'python main.py --list-themes' for the non-interactive interface.")
-    print()
+    print(_INTERACTIVE_BANNER)
     
     # Get initial seed
     user_seed = get_user_seed()
@@ -231,27 +278,26 @@ def _select_theme_with_navigation(available_themes, current_theme_key=None, curr
             theme_selection_prompt = chosen_theme_key
             return chosen_theme_key, theme_selection_prompt
     else:
+        # The theme menu only changes with available_themes, so build it once for every redraw
+        theme_menu = "\n".join(
+            ["Available themes:", "  0. Random Theme"]
+            + [f"  {i+1}. {th_key}" for i, th_key in enumerate(available_themes)]
+        )
+        max_theme_option = len(available_themes)
+
         # Interactive selection loop with navigation
         while True:
-            os.system('cls' if os.name == 'nt' else 'clear')
+            clear_screen()
             
             # Display current settings
             seed_display = current_seed if current_seed is not None else "Random"
             print(f"Current Settings: Seed = {seed_display}, Metafiction = {current_metafiction}")
             print()
             
-            print("Available themes:")
-            print("  0. Random Theme")
-            for i, th_key in enumerate(available_themes):
-                print(f"  {i+1}. {th_key}")
+            print(theme_menu)
             print()
-            print("Navigation Options:")
-            print("  s. Change seed")
-            print("  m. Change metafiction level")
-            print("  i. Theme information")
-            print("  h. CLI help")
+            print(_NAVIGATION_OPTIONS)
 
-            max_theme_option = len(available_themes)
             choice = input(f"Select a theme number (0-{max_theme_option}), or option (s/m/i/h): ").strip().lower()
 
             if choice == 's':
@@ -318,7 +364,7 @@ def build_output_filename(theme_key, seed, generation_time):
     timestamp = generation_time.strftime("%Y%m%d-%H%M%S")
     return f"{theme_part}-seed-{seed}-{timestamp}.md"
 
-def generate_with_seed_and_theme(seed=None, theme_key=None, export_option=None, metafiction_level='moderate', output_filename=None, interactive=False):
+def generate_with_seed_and_theme(seed=None, theme_key=None, export_option=None, metafiction_level='moderate', output_filename=None, interactive=False, quiet=False):
     """Generate an essay with an optional random seed and theme."""
     final_seed_used = None # Initialize here
     if seed is not None: # Specific seed provided by user or args
@@ -345,8 +391,11 @@ def generate_with_seed_and_theme(seed=None, theme_key=None, export_option=None,
 
     print(f"\n--- Generating Essay ---")
     print(f"Active theme set to: {chosen_theme_key}, Seed: {final_seed_used}")
+    # Deferred so --help, --list-themes and argument errors never load the generator modules
+    from essay import generate_essay
     essay_content = generate_essay(theme_key=chosen_theme_key, metafiction_level=metafiction_level)
-    print(essay_content)
+    if not quiet:
+        print(essay_content)
 
     # Handle export based on CLI option or prompt user
     if export_option == "export":
@@ -403,9 +452,7 @@ def main(argv=None):
     elif args.no_export:
         export_option = "no-export"
     
-    available_themes = get_available_themes()
-
-    if args.theme and args.theme not in available_themes:
+    if args.theme and args.theme not in _AVAILABLE_THEME_SET:
         parser.error(
             f"Theme key '{args.theme}' is not valid. "
             f"Use --list-themes to see valid keys."
@@ -421,7 +468,8 @@ def main(argv=None):
         export_option=export_option,
         metafiction_level=user_metafiction_level,
         output_filename=output_filename,
-        interactive=not cli_args_provided
+        interactive=not cli_args_provided,
+        quiet=args.quiet
     )
     return 0
 
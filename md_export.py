@@ -18,6 +18,18 @@ def export_to_markdown(essay_content, filename=None, essay_config=None, interact
         essay_config (dict, optional): Dictionary containing generation config (seed, theme, date).
         interactive (bool, optional): Whether export may prompt on missing filename or I/O failures.
     """
+    # Prepare config header once; it does not change across filename retries
+    config_header = ""
+    if essay_config:
+        config_header = (
+            f"---\n"
+            f"Seed: {essay_config.get('seed_used', 'N/A')}\n"
+            f"Theme: {essay_config.get('theme_selected', 'N/A')}\n"
+            f"Metafiction Level: {essay_config.get('metafiction_level', 'N/A')}\n"
+            f"Generated: {essay_config.get('generation_date', 'N/A')}\n"
+            f"---\n\n"
+        )
+
     while True:
         if not filename:
             if not interactive:
@@ -29,24 +41,26 @@ def export_to_markdown(essay_content, filename=None, essay_config=None, interact
                 return False # Indicate skipped
             filename = fn_input
 
-        # Ensure the 'essays' directory exists
+        # Ensure the 'essays' directory exists; attempting the mkdir directly (rather than
+        # checking first) is a single call and cannot race with another process creating it
         output_dir = "essays"
-        if not os.path.exists(output_dir):
-            try:
-                os.makedirs(output_dir)
-                print(f"Created directory: {output_dir}")
-            except OSError as e:
-                print(f"Error creating directory {output_dir}: {e}")
-                if not interactive:
-                    return False
-                # Allow user to skip if directory creation fails
-                skip_choice = input("Failed to create output directory. Skip export? (yes/no): ").strip().lower()
-                if skip_choice in ["yes", "y"]:
-                    print("Markdown export skipped.")
-                    return False
-                else:
-                    print("Cannot proceed without output directory. Export aborted.")
-                    return False
+        try:
+            os.makedirs(output_dir)
+            print(f"Created directory: {output_dir}")
+        except FileExistsError:
+            pass
+        except OSError as e:
+            print(f"Error creating directory {output_dir}: {e}")
+            if not interactive:
+                return False
+            # Allow user to skip if directory creation fails
+            skip_choice = input("Failed to create output directory. Skip export? (yes/no): ").strip().lower()
+            if skip_choice in ["yes", "y"]:
+                print("Markdown export skipped.")
+                return False
+            else:
+                print("Cannot proceed without output directory. Export aborted.")
+                return False
         
         # Prepend directory to filename
         filepath = os.path.join(output_dir, filename)
@@ -56,20 +70,11 @@ def export_to_markdown(essay_content, filename=None, essay_config=None, interact
             print(f"Filename amended to: {filepath}")
         
         try:
-            # Prepare config header
-            config_header = ""
-            if essay_config:
-                config_header += f"---\n"
-                config_header += f"Seed: {essay_config.get('seed_used', 'N/A')}\n"
-                config_header += f"Theme: {essay_config.get('theme_selected', 'N/A')}\n"
-                config_header += f"Metafiction Level: {essay_config.get('metafiction_level', 'N/A')}\n"
-                config_header += f"Generated: {essay_config.get('generation_date', 'N/A')}\n"
-                config_header += f"---\n\n"
-            
-            full_content_to_write = config_header + essay_content
-
+            # Write the header and essay separately rather than copying the whole essay
+            # into a concatenated string first; text mode keeps platform newline handling
             with open(filepath, "w", encoding="utf-8") as f:
-                f.write(full_content_to_write)
+                f.write(config_header)
+                f.write(essay_content)
             print(f"Essay successfully exported to {filepath}")
             return True # Indicate success
         except IOError as e:
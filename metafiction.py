@@ -74,12 +74,83 @@ STRATEGIC_PLACEMENT_INDICATORS = {
     ]
 }
 
-def detect_strategic_moment(paragraph_text, sentence_index=None, total_sentences=None):
+# Phrases that mark a paragraph as already metafictional, so no further reflection is added
+METAFICTIONAL_INDICATORS = (
+    "this essay", "this text", "this paper", "this analysis", 
+    "in writing", "the author", "inevitably", "implicated", 
+    "complicit", "paradox", "entangled", "self-reflexive",
+    "reproduces existing paradigms", "discourses it critiques", 
+    "economy of academic knowledge production", "logic it seeks to critique", 
+    "theoretical tools to critique", "systems under examination"
+)
+
+# Sentence boundaries used when placing a metafictional element inside a paragraph
+_SENTENCE_SPLIT_PATTERN = re.compile(r'(?<=[.?!])\s+(?=[A-Z])|(?<=[.?!])$\s*')
+_SENTENCE_END_PUNCTUATION = ('.', '!', '?')
+
+# Base metafictional templates, extended below by strategic moment and theme
+_BASE_METAFICTION_TEMPLATES = (
+    "It bears asking whether this line of reasoning merely reproduces existing paradigms.",
+    "This analysis acknowledges its own complicity in the very discourses it critiques.",
+    "In doing so, this paper inevitably participates in the economy of academic knowledge production it seeks to interrogate.",
+    "The inherent contradictions of such an approach will become apparent as the argument unfolds.",
+    "To what extent can this investigation escape the very logic it seeks to critique?",
+    "This paper remains aware of the paradox inherent in employing theoretical tools to critique those same tools.",
+    "In articulating these critiques, I acknowledge the impossibility of a position fully exterior to the systems under examination.",
+    "The methodology employed here is necessarily implicated in the structures it attempts to analyze.",
+    "This text performs the very tensions it describes.",
+    "Such an approach raises questions about the possibility of critical distance in theoretical discourse.",
+)
+
+_STRATEGIC_METAFICTION_TEMPLATES = {
+    'bold_claim': (
+        "The confidence of this assertion perhaps conceals the uncertainty it attempts to master.",
+        "Such definitiveness in theoretical discourse warrants suspicion of its own conditions of possibility.",
+        "The rhetorical force of this claim may exceed its theoretical justification.",
+    ),
+    'dense_theoretical': (
+        "The deployment of such theoretical machinery risks obscuring the very phenomena it purports to illuminate.",
+        "This conceptual apparatus, for all its sophistication, remains embedded within the discursive field it seeks to map.",
+        "The density of theoretical reference here perhaps betrays an anxiety about the solidity of the ground being traversed.",
+    ),
+    'dialectical_transition': (
+        "This argumentative pivot reveals the extent to which the analysis remains captive to the binary logic it ostensibly transcends.",
+        "The very gesture of transition here enacts the dialectical movement the text describes, while perhaps remaining unconscious of this performance.",
+        "Such moments of theoretical reversal often mask the persistence of the assumptions they claim to overcome.",
+    ),
+}
+
+_THEMED_METAFICTION_TEMPLATES = {
+    "Technology, Media, and Culture": (
+        "This textual analysis ironically attempts to grasp a digitally saturated, post-literate condition.",
+        "The medium of academic prose struggles to represent the very media transformations it analyzes.",
+        "Writing about digital culture necessarily involves an anachronistic gesture toward textual authority.",
+    ),
+    "Power and Knowledge": (
+        "The very act of articulating this critique of power is itself a discursive move within a field of power.",
+        "Knowledge production about power/knowledge cannot escape the apparatus it describes.",
+        "This genealogical analysis participates in the very regimes of truth it seeks to historicize.",
+    ),
+    "Decoloniality and Postcolonial Studies": (
+        "Can this analysis, framed within Western academic discourse, truly decenter dominant epistemologies?",
+        "The institutional context of this critique may constrain its decolonial aspirations.",
+        "Writing about decoloniality within the academy enacts a constitutive tension that cannot be simply resolved.",
+    ),
+    "Digital Subjectivity": (
+        "This analysis of digital subjectivity is itself mediated by the technological infrastructure it examines.",
+        "The subject position of the author in digital networks complicates any claimed critical distance.",
+        "Theorizing networked identity necessarily involves the entanglement of the theorist in digital assemblages.",
+    ),
+}
+
+def detect_strategic_moment(paragraph_text, sentence_index=None, total_sentences=None, text_lower=None):
     """
     Detect if this is a strategic moment for metafictional insertion.
+    Callers that already hold the lowercased paragraph can pass it as text_lower.
     Returns a tuple: (is_strategic, moment_type, placement_weight)
     """
-    text_lower = paragraph_text.lower()
+    if text_lower is None:
+        text_lower = paragraph_text.lower()
     
     # Check for bold claims
     bold_claim_count = sum(1 for indicator in STRATEGIC_PLACEMENT_INDICATORS['bold_claims'] 
@@ -146,23 +217,21 @@ def should_insert_metafiction(paragraph_text, metafiction_level='moderate', sect
         return False, 0.0, {}
     
     # Check for existing metafictional indicators to avoid redundancy
-    metafictional_indicators = [
-        "this essay", "this text", "this paper", "this analysis", 
-        "in writing", "the author", "inevitably", "implicated", 
-        "complicit", "paradox", "entangled", "self-reflexive",
-        "reproduces existing paradigms", "discourses it critiques", 
-        "economy of academic knowledge production", "logic it seeks to critique", 
-        "theoretical tools to critique", "systems under examination"
-    ]
+    paragraph_text_lower = paragraph_text.lower()
+    if any(indicator in paragraph_text_lower for indicator in METAFICTIONAL_INDICATORS):
+        return False, 0.0, {}
     
-    if any(indicator in paragraph_text.lower() for indicator in metafictional_indicators):
+    # The final probability is capped at 0.4, so a roll at or above the cap can
+    # never insert; draw it now and skip the strategic scan for those paragraphs
+    roll = random.random()
+    if roll >= 0.4:
         return False, 0.0, {}
     
     # Base probability from configuration
     base_probability = config['paragraph_probability']
     
     # Detect strategic moments
-    is_strategic, moment_type, strategic_weight = detect_strategic_moment(paragraph_text)
+    is_strategic, moment_type, strategic_weight = detect_strategic_moment(paragraph_text, text_lower=paragraph_text_lower)
     
     # Adjust probability based on strategic context
     if is_strategic:
@@ -194,75 +263,20 @@ def should_insert_metafiction(paragraph_text, metafiction_level='moderate', sect
         'strategic_weight': strategic_weight
     }
     
-    return random.random() < final_probability, final_probability, strategic_info
+    return roll < final_probability, final_probability, strategic_info
 
 def generate_metafictional_element(theme_key=None, coherence_manager=None, 
                                  strategic_context=None, metafiction_level='moderate'):
     """Generate a metafictional element, potentially themed and contextually aware."""
-    # Base templates remain the same, but we can select based on context
-    templates = [
-        "It bears asking whether this line of reasoning merely reproduces existing paradigms.",
-        "This analysis acknowledges its own complicity in the very discourses it critiques.",
-        "In doing so, this paper inevitably participates in the economy of academic knowledge production it seeks to interrogate.",
-        "The inherent contradictions of such an approach will become apparent as the argument unfolds.",
-        "To what extent can this investigation escape the very logic it seeks to critique?",
-        "This paper remains aware of the paradox inherent in employing theoretical tools to critique those same tools.",
-        "In articulating these critiques, I acknowledge the impossibility of a position fully exterior to the systems under examination.",
-        "The methodology employed here is necessarily implicated in the structures it attempts to analyze.",
-        "This text performs the very tensions it describes.",
-        "Such an approach raises questions about the possibility of critical distance in theoretical discourse."
-    ]
+    templates = _BASE_METAFICTION_TEMPLATES
     
     # Add context-specific templates based on strategic moment
     if strategic_context and strategic_context.get('is_strategic'):
-        moment_type = strategic_context.get('moment_type')
-        
-        if moment_type == 'bold_claim':
-            templates.extend([
-                "The confidence of this assertion perhaps conceals the uncertainty it attempts to master.",
-                "Such definitiveness in theoretical discourse warrants suspicion of its own conditions of possibility.",
-                "The rhetorical force of this claim may exceed its theoretical justification."
-            ])
-        elif moment_type == 'dense_theoretical':
-            templates.extend([
-                "The deployment of such theoretical machinery risks obscuring the very phenomena it purports to illuminate.",
-                "This conceptual apparatus, for all its sophistication, remains embedded within the discursive field it seeks to map.",
-                "The density of theoretical reference here perhaps betrays an anxiety about the solidity of the ground being traversed."
-            ])
-        elif moment_type == 'dialectical_transition':
-            templates.extend([
-                "This argumentative pivot reveals the extent to which the analysis remains captive to the binary logic it ostensibly transcends.",
-                "The very gesture of transition here enacts the dialectical movement the text describes, while perhaps remaining unconscious of this performance.",
-                "Such moments of theoretical reversal often mask the persistence of the assumptions they claim to overcome."
-            ])
-    
-    # Theme-specific additions (expanded from previous version)
+        templates += _STRATEGIC_METAFICTION_TEMPLATES.get(strategic_context.get('moment_type'), ())
+    
+    # Theme-specific additions
     if theme_key and theme_key in thematic_clusters:
-        theme_data = thematic_clusters[theme_key]
-        if theme_key == "Technology, Media, and Culture":
-            templates.extend([
-                "This textual analysis ironically attempts to grasp a digitally saturated, post-literate condition.",
-                "The medium of academic prose struggles to represent the very media transformations it analyzes.",
-                "Writing about digital culture necessarily involves an anachronistic gesture toward textual authority."
-            ])
-        elif theme_key == "Power and Knowledge":
-            templates.extend([
-                "The very act of articulating this critique of power is itself a discursive move within a field of power.",
-                "Knowledge production about power/knowledge cannot escape the apparatus it describes.",
-                "This genealogical analysis participates in the very regimes of truth it seeks to historicize."
-            ])
-        elif theme_key == "Decoloniality and Postcolonial Studies":
-            templates.extend([
-                "Can this analysis, framed within Western academic discourse, truly decenter dominant epistemologies?",
-                "The institutional context of this critique may constrain its decolonial aspirations.",
-                "Writing about decoloniality within the academy enacts a constitutive tension that cannot be simply resolved."
-            ])
-        elif theme_key == "Digital Subjectivity":
-            templates.extend([
-                "This analysis of digital subjectivity is itself mediated by the technological infrastructure it examines.",
-                "The subject position of the author in digital networks complicates any claimed critical distance.",
-                "Theorizing networked identity necessarily involves the entanglement of the theorist in digital assemblages."
-            ])
+        templates += _THEMED_METAFICTION_TEMPLATES.get(theme_key, ())
 
     chosen_template = random.choice(templates)
 
@@ -344,14 +358,13 @@ def insert_metafiction_in_paragraph(paragraph_text, theme_key=None, coherence_ma
     if paragraph_text.endswith('.'):
         paragraph_text = paragraph_text[:-1]
 
-    sentences = re.split(r'(?<=[.?!])\s+(?=[A-Z])|(?<=[.?!])$\s*', paragraph_text.strip())
-    sentences = [s.strip() for s in sentences if s.strip()]
+    sentences = [s for s in map(str.strip, _SENTENCE_SPLIT_PATTERN.split(paragraph_text.strip())) if s]
 
     if not sentences:
         return metafictional_text
 
     if len(sentences) <= 1:
-        if sentences and not sentences[-1].endswith(tuple('.!?')):
+        if sentences and not sentences[-1].endswith(_SENTENCE_END_PUNCTUATION):
             return sentences[-1] + ". " + metafictional_text
         elif sentences:
             return sentences[-1] + " " + metafictional_text
@@ -366,7 +379,7 @@ def insert_metafiction_in_paragraph(paragraph_text, theme_key=None, coherence_ma
             # Default placement in latter half of paragraph
             insert_position = random.randint(len(sentences) // 2, len(sentences) - 1)
         
-        if not sentences[insert_position - 1].endswith(tuple('.!?')):
+        if not sentences[insert_position - 1].endswith(_SENTENCE_END_PUNCTUATION):
             sentences[insert_position - 1] += '.'
         sentences.insert(insert_position, metafictional_text)
         return " ".join(sentences)
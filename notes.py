@@ -21,6 +21,21 @@ from reference import strip_markdown_italics, generate_title as generate_referen
 # philosopher_key_works = {}  # REMOVE - Will use data_philosopher_key_works from data.py
 # publishers = ["University Press", "Academic Books Inc."] # REMOVE - Will use data_publishers from data.py
 
+# Philosophers keyed by lowercased name (first spelling wins), so author normalization resolves
+# a case-insensitive match with one dict lookup instead of scanning the whole list
+_PHILOSOPHERS_BY_LOWER = {}
+for _philosopher in philosophers:
+    _PHILOSOPHERS_BY_LOWER.setdefault(_philosopher.lower(), _philosopher)
+_PHILOSOPHER_NAMES = frozenset(philosophers)
+
+# Punctuation dropped from titles before they are compared for similarity
+_TITLE_PUNCTUATION_PATTERN = re.compile(r'[^\w\s]')
+
+
+def _normalize_title_for_comparison(title):
+    """Lowercase a title and strip its punctuation for similarity checks."""
+    return _TITLE_PUNCTUATION_PATTERN.sub('', title.lower()) if title else ""
+
 class NoteSystem:
     """
     A system for managing notes (footnotes) and bibliography entries in a postmodern essay.
@@ -110,7 +125,7 @@ class NoteSystem:
         if (
             candidate in data_philosopher_key_works
             or candidate in philosopher_concepts
-            or candidate in philosophers
+            or candidate in _PHILOSOPHER_NAMES
         ):
             return candidate
 
@@ -120,15 +135,11 @@ class NoteSystem:
             if (
                 reordered in data_philosopher_key_works
                 or reordered in philosopher_concepts
-                or reordered in philosophers
+                or reordered in _PHILOSOPHER_NAMES
             ):
                 return reordered
 
-        for philosopher in philosophers:
-            if philosopher.lower() == candidate.lower():
-                return philosopher
-
-        return candidate
+        return _PHILOSOPHERS_BY_LOWER.get(candidate.lower(), candidate)
 
     def _format_author_for_bibliography(self, author_name):
         """Format an author name into the bibliography display form used by MLA entries."""
@@ -471,13 +482,14 @@ class NoteSystem:
             bool: True if duplicate found, False otherwise
         """
         author = self._extract_author_for_note(reference)
-        title = self._extract_title_sorting_key(reference)
+        normalized_title = _normalize_title_for_comparison(self._extract_title_sorting_key(reference))
         
         for ref in self.works_cited:
-            ref_author = self._extract_author_for_note(ref)
+            # Titles only matter for the same author, so skip extracting them otherwise
+            if author != self._extract_author_for_note(ref):
+                continue
             ref_title = self._extract_title_sorting_key(ref)
-            
-            if author == ref_author and self._titles_are_similar(title, ref_title):
+            if self._normalized_titles_are_similar(normalized_title, _normalize_title_for_comparison(ref_title)):
                 return True
                 
         return False
@@ -493,9 +505,13 @@ class NoteSystem:
         Returns:
             bool: True if titles are similar, False otherwise
         """
-        t1 = re.sub(r'[^\w\s]', '', title1.lower()) if title1 else ""
-        t2 = re.sub(r'[^\w\s]', '', title2.lower()) if title2 else ""
-        
+        return self._normalized_titles_are_similar(
+            _normalize_title_for_comparison(title1),
+            _normalize_title_for_comparison(title2),
+        )
+
+    def _normalized_titles_are_similar(self, t1, t2):
+        """Compare two titles already passed through _normalize_title_for_comparison."""
         if not t1 or not t2:
             return False
             
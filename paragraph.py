@@ -16,12 +16,17 @@ academic standards and MLA 9 citation formatting.
 
 import random
 import re
-from collections import Counter
 from sentence import generate_sentence
+from coherence import get_philosophers_by_concept
 from json_data_provider import philosophers, concepts, terms, philosopher_concepts, rhetorical_devices, discursive_modes
 from capitalization import ensure_proper_capitalization
 from sentence import ensure_quote_has_citation
 
+# Hashed views of the vocabulary for the per-sentence proper-noun checks
+_CONCEPT_SET = frozenset(concepts)
+_TERM_SET = frozenset(terms)
+_PHILOSOPHER_SET = frozenset(philosophers)
+
 # Enhanced list of transitional expressions for academic writing
 transitional_expressions = [
     # Additive transitions
@@ -63,6 +68,24 @@ transitional_expressions = [
     "as Spivak might suggest", "in the spirit of Haraway", "echoing Jameson"
 ]
 
+# Position-specific transition pools, filtered once from transitional_expressions
+# (in its order) rather than rebuilt for every sentence
+_ADDITIVE_TRANSITIONS = tuple(
+    t for t in transitional_expressions
+    if t in ("moreover", "furthermore", "additionally", "similarly",
+             "likewise", "in addition", "what is more")
+)
+_CONCLUDING_TRANSITIONS = tuple(
+    t for t in transitional_expressions
+    if t in ("therefore", "consequently", "thus", "hence",
+             "in conclusion", "ultimately", "in sum")
+)
+_CONTRASTIVE_TRANSITIONS = tuple(
+    t for t in transitional_expressions
+    if "however" in t or "contrast" in t or "yet" in t or "though" in t
+    or "conversely" in t or "on the other hand" in t
+)
+
 # References to academic writing conventions
 meta_references = [
     "as I have argued elsewhere", "as noted above", "as will become clear",
@@ -162,9 +185,8 @@ def generate_paragraph(template_type, num_sentences, forbidden_philosophers=[],
             if paragraph_theme_concept:
                 # Prefer philosophers related to the chosen concept
                 candidate_philosophers = [
-                    p for p, concepts_list in coherence_manager.philosopher_concepts.items()
-                    if paragraph_theme_concept in concepts_list
-                    and p not in forbidden_philosophers_set
+                    p for p in get_philosophers_by_concept(coherence_manager.philosopher_concepts).get(paragraph_theme_concept, ())
+                    if p not in forbidden_philosophers_set
                     and p not in coherence_manager.used_philosophers
                 ]
                 if surface_local and coherence_manager.active_theme_key:
@@ -357,18 +379,12 @@ def generate_paragraph(template_type, num_sentences, forbidden_philosophers=[],
     for i in range(1, len(selected_sentences_texts)):
         # Decide on transition type based on position in paragraph
         if i == 1:  # For the second sentence, often use additive transitions
-            transition_pool = [t for t in transitional_expressions if t in 
-                              ["moreover", "furthermore", "additionally", "similarly", 
-                               "likewise", "in addition", "what is more"]]
+            transition_pool = _ADDITIVE_TRANSITIONS
         elif i == len(selected_sentences_texts) - 1:  # For the final sentence, use concluding transitions
-            transition_pool = [t for t in transitional_expressions if t in 
-                              ["therefore", "consequently", "thus", "hence", 
-                               "in conclusion", "ultimately", "in sum"]]
+            transition_pool = _CONCLUDING_TRANSITIONS
         else:  # For middle sentences, use a mix of transitions with emphasis on contrastive
             if random.random() < 0.4:  # 40% chance of contrastive
-                transition_pool = [t for t in transitional_expressions if "however" in t 
-                                 or "contrast" in t or "yet" in t or "though" in t
-                                 or "conversely" in t or "on the other hand" in t]
+                transition_pool = _CONTRASTIVE_TRANSITIONS
             else:  # Otherwise use the full pool
                 transition_pool = transitional_expressions
         
@@ -385,18 +401,20 @@ def generate_paragraph(template_type, num_sentences, forbidden_philosophers=[],
         words = sentence.split()
         
         # Don't decapitalize proper nouns or the beginnings of quotes
-        if words and words[0].lower() not in terms and words[0].lower() not in concepts and words[0] not in philosophers:
+        if words and words[0].lower() not in _TERM_SET and words[0].lower() not in _CONCEPT_SET and words[0] not in _PHILOSOPHER_SET:
             # Don't lowercase if it's a quoted passage
             if not (words[0].startswith('"') or words[0].startswith("'")):
                 sentence = words[0].lower() + ' ' + ' '.join(words[1:]) if len(words) > 1 else words[0].lower()
         
-        # Apply capitalization to ensure proper nouns are capitalized, but DON'T capitalize the first letter
-        sentence = ensure_proper_capitalization(sentence, capitalize_first=False)
-        
         paragraph_sentences.append(f"{transition} {sentence}")
 
     # Combine sentences into paragraph
     paragraph_str = ' '.join(paragraph_sentences)
+
+    # Capitalize proper nouns across all the transitioned sentences in one pass,
+    # but DON'T capitalize the first letter (the first sentence is already done)
+    if len(paragraph_sentences) > 1:
+        paragraph_str = ensure_proper_capitalization(paragraph_str, capitalize_first=False)
     
     # Handle [citation] placeholders with MLA 9 style citations
     if '[citation]' in paragraph_str:
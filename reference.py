@@ -25,6 +25,11 @@ CLEANED_PHILOSOPHERS_REF = [
 if not CLEANED_PHILOSOPHERS_REF:  # Fallback if cleaning results in an empty list
     CLEANED_PHILOSOPHERS_REF = ["Michel Foucault", "Judith Butler", "Jacques Derrida", "Slavoj Žižek"]
 
+# Cleaned philosophers keyed by lowercased name (first spelling wins) for case-insensitive lookups
+_CLEANED_PHILOSOPHERS_BY_LOWER = {}
+for _philosopher in CLEANED_PHILOSOPHERS_REF:
+    _CLEANED_PHILOSOPHERS_BY_LOWER.setdefault(_philosopher.lower(), _philosopher)
+
 # Placeholder definitions for variables used in this module but not sourced from data.py
 # REMOVE the local generic publishers list; we'll use the one from data.py
 # publishers = ["Academic Press", "University Press", "Scholarly Books"] 
@@ -36,11 +41,13 @@ last_names = ["Reed", "Hayes", "Chen", "Sinclair", "Al-Jamil", "Valerio", "Orteg
 # From prominent philosophers to cite
 # philosopher_names = [p.split()[-1] for p in philosophers] # No longer needed here directly if philosophers list is used
 
+_MARKDOWN_ITALICS_TABLE = str.maketrans('', '', '*_')
+
 def strip_markdown_italics(text: str) -> str:
     """Remove markdown italics (asterisks or underscores) from a string."""
     if not isinstance(text, str): # Handle cases where text might not be a string
         return str(text)
-    return text.replace('*', '').replace('_', '')
+    return text.translate(_MARKDOWN_ITALICS_TABLE)
 
 def generate_full_name():
     """Generate a complete author name. Ensures a non-empty, plausible name."""
@@ -78,11 +85,7 @@ def _normalize_author_lookup_name(author_name):
         if reordered in philosopher_concepts:
             return reordered
 
-    for philosopher in CLEANED_PHILOSOPHERS_REF:
-        if philosopher.lower() == candidate.lower():
-            return philosopher
-
-    return None
+    return _CLEANED_PHILOSOPHERS_BY_LOWER.get(candidate.lower())
 
 
 def _get_author_specific_vocab(author_name):
@@ -17,9 +17,12 @@ from __future__ import annotations
 
 import argparse
 import json
+import multiprocessing
+import os
 import random
 import re
 import sys
+from concurrent.futures import ProcessPoolExecutor
 from pathlib import Path
 
 REPO_ROOT = Path(__file__).resolve().parent.parent
@@ -46,6 +49,11 @@ CASES = [
     ("Digital Subjectivity", 314),
 ]
 
+# Sentence assembly still varies with set iteration order, so every case is captured
+# under each of these PYTHONHASHSEED values and the content floors come from the
+# weakest run instead of whichever hash seed the capture process happened to get.
+HASH_SEEDS = tuple(range(20))
+
 
 def _body_sections(text: str) -> list[tuple[str, str]]:
     matches = list(re.finditer(r"^## (.+)$", text, flags=re.MULTILINE))
@@ -85,36 +93,77 @@ def _distinct_surface_hits(text: str, theme: dict) -> int:
     return sum(1 for candidate in candidates if candidate.lower() in haystack)
 
 
-def capture_cases() -> dict:
-    data = _load_data()
+def _capture_case(case: tuple[str, int]) -> dict:
+    theme_name, seed = case
+    random.seed(seed)
+    essay = generate_essay(theme_key=theme_name, metafiction_level="moderate")
+    theme = _load_data()["thematic_clusters"][theme_name]
+    title_match = re.search(r"^# (.+)$", essay, flags=re.MULTILINE)
+    keyword_match = re.search(r"^\*\*Keywords:\*\* (.+)$", essay, flags=re.MULTILINE)
+    first_heading, first_body = _body_sections(essay)[0]
+    first_paragraph = _normalize_whitespace(first_body.split("\n\n", 1)[0].strip())
+    keywords = [
+        _normalize_keyword(keyword)
+        for keyword in keyword_match.group(1).split(",")
+        if _normalize_keyword(keyword)
+    ] if keyword_match else []
+    return {
+        "theme": theme_name,
+        "seed": seed,
+        "title": title_match.group(1).strip() if title_match else "",
+        "keywords": sorted(keywords),
+        "heading_surface_hits": _distinct_surface_hits(first_heading, theme),
+        "paragraph_theme_hits": _distinct_theme_hits(first_paragraph, theme),
+        "first_heading": first_heading,
+        "first_paragraph": first_paragraph,
+    }
+
+
+def _capture_under_hash_seed(hash_seed: int, max_workers: int | None) -> list[dict]:
+    # Spawned workers are fresh interpreters, so they pick up the PYTHONHASHSEED
+    # present in the environment when they start.
+    previous = os.environ.get("PYTHONHASHSEED")
+    os.environ["PYTHONHASHSEED"] = str(hash_seed)
+    try:
+        with ProcessPoolExecutor(
+            max_workers=max_workers,
+            mp_context=multiprocessing.get_context("spawn"),
+        ) as executor:
+            return list(executor.map(_capture_case, CASES))
+    finally:
+        if previous is None:
+            del os.environ["PYTHONHASHSEED"]
+        else:
+            os.environ["PYTHONHASHSEED"] = previous
+
+
+def capture_cases(max_workers: int | None = None) -> dict:
+    # Each case reseeds the global RNG and builds its own essay, so cases are
+    # independent and can be generated in separate worker processes.
+    runs = [_capture_under_hash_seed(hash_seed, max_workers) for hash_seed in HASH_SEEDS]
+
     cases = []
-    for theme_name, seed in CASES:
-        random.seed(seed)
-        essay = generate_essay(theme_key=theme_name, metafiction_level="moderate")
-        theme = data["thematic_clusters"][theme_name]
-        title_match = re.search(r"^# (.+)$", essay, flags=re.MULTILINE)
-        keyword_match = re.search(r"^\*\*Keywords:\*\* (.+)$", essay, flags=re.MULTILINE)
-        first_heading, first_body = _body_sections(essay)[0]
-        first_paragraph = _normalize_whitespace(first_body.split("\n\n", 1)[0].strip())
-        keywords = [
-            _normalize_keyword(keyword)
-            for keyword in keyword_match.group(1).split(",")
-            if _normalize_keyword(keyword)
-        ] if keyword_match else []
-        cases.append(
-            {
-                "theme": theme_name,
-                "seed": seed,
-                "metafiction_level": "moderate",
-                "title": title_match.group(1).strip() if title_match else "",
-                "keywords": sorted(keywords),
-                # Leave a small buffer for sentence-assembly variance across Python processes.
-                "min_heading_surface_hits": max(1, _distinct_surface_hits(first_heading, theme) - 2),
-                "min_paragraph_theme_hits": max(7, _distinct_theme_hits(first_paragraph, theme) - 4),
-                "reference_first_heading": first_heading,
-                "reference_first_paragraph": first_paragraph,
-            }
-        )
+    for case_runs in zip(*runs):
+        reference = case_runs[0]
+        for run in case_runs[1:]:
+            if (run["title"], run["keywords"]) != (reference["title"], reference["keywords"]):
+                raise RuntimeError(
+                    f"{reference['theme']} seed {reference['seed']} produced a different title or "
+                    "keyword set under another PYTHONHASHSEED; the fixture cannot pin it."
+                )
+        cases.append({
+            "theme": reference["theme"],
+            "seed": reference["seed"],
+            "metafiction_level": "moderate",
+            "title": reference["title"],
+            "keywords": reference["keywords"],
+            # Leave a small buffer below the weakest run; the paragraph floor of 7 is the
+            # minimum theme-local content these historically noisy themes must keep.
+            "min_heading_surface_hits": max(1, min(run["heading_surface_hits"] for run in case_runs) - 2),
+            "min_paragraph_theme_hits": max(7, min(run["paragraph_theme_hits"] for run in case_runs) - 4),
+            "reference_first_heading": reference["first_heading"],
+            "reference_first_paragraph": reference["first_paragraph"],
+        })
 
     return {"cases": cases}
 
@@ -126,12 +175,18 @@ def main() -> int:
         default=str(DEFAULT_OUTPUT),
         help="Path to the JSON fixture file to write.",
     )
+    parser.add_argument(
+        "--jobs",
+        type=int,
+        default=None,
+        help="Number of worker processes (defaults to the CPU count).",
+    )
     args = parser.parse_args()
 
     output_path = Path(args.output)
     output_path.parent.mkdir(parents=True, exist_ok=True)
     output_path.write_text(
-        json.dumps(capture_cases(), ensure_ascii=False, indent=2) + "\n",
+        json.dumps(capture_cases(max_workers=args.jobs), ensure_ascii=False, indent=2) + "\n",
         encoding="utf-8",
     )
     print(f"Wrote regression fixture to {output_path}")
@@ -694,7 +694,11 @@ def _generate_general_sentence(mentioned_philosophers, forbidden_philosophers,
     
     # Get title themes if available
     title_themes = context.get('title_themes', {})
-    title_concepts = title_themes.get('primary_concepts', []) + title_themes.get('related_concepts', []) if title_themes else []
+    # Callers outside extract_themes_from_title may pass only the documented keys
+    title_concepts = (
+        title_themes.get('combined_concepts')
+        or title_themes.get('primary_concepts', []) + title_themes.get('related_concepts', [])
+    ) if title_themes else []
     title_terms = title_themes.get('primary_terms', []) if title_themes else []
     
     _populate_philosopher_fields(fields, data, available_philosophers, used_philosophers, mentioned_philosophers, coherence_manager)
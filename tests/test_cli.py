@@ -77,6 +77,21 @@ class CLITest(unittest.TestCase):
         self.assertNotEqual(0, result.returncode)
         self.assertIn("--output cannot be used with --no-export", result.stderr)
 
+    def test_quiet_run_does_not_print_the_essay(self):
+        result = subprocess.run(
+            [sys.executable, "main.py", "--seed", "42", "--theme", "Digital Subjectivity", "--no-export", "--quiet"],
+            cwd=REPO_ROOT,
+            capture_output=True,
+            text=True,
+            timeout=60,
+            check=False,
+        )
+
+        self.assertEqual(0, result.returncode, result.stderr)
+        self.assertIn("--- Generating Essay ---", result.stdout)
+        self.assertIn("Essay not exported (--no-export specified).", result.stdout)
+        self.assertNotIn("## Conclusion", result.stdout)
+
     def test_zero_argument_run_uses_interactive_setup_and_can_skip_export(self):
         result = self._run_interactive("\n\n0\nn\n")
 
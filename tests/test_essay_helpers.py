@@ -0,0 +1,51 @@
+import unittest
+
+import random
+
+from essay import _select_section_philosopher, extract_themes_from_title, find_relevant_philosophers
+from json_data_provider import concepts, philosopher_concepts, terms
+
+
+class TitleThemeExtractionTest(unittest.TestCase):
+    def test_explicit_mentions_match_plain_substring_scan(self):
+        raw_title = f"{concepts[0]} and {terms[0]}: Beyond {concepts[1]}".upper()
+
+        title_themes = extract_themes_from_title(raw_title, concepts, terms)
+
+        lowered = raw_title.lower()
+        expected_concepts = {concept for concept in concepts if concept.lower() in lowered}
+        self.assertEqual(expected_concepts, set(title_themes['primary_concepts']))
+        for term in terms:
+            if term.lower() in lowered and term not in expected_concepts:
+                self.assertIn(term, title_themes['primary_terms'])
+
+    def test_repeated_titles_do_not_share_mutable_results(self):
+        raw_title = f"{concepts[0]} and {terms[0]}: Beyond {concepts[1]}"
+
+        first = extract_themes_from_title(raw_title, concepts, terms)
+        first['primary_concepts'].append("mutated")
+        second = extract_themes_from_title(raw_title, concepts, terms)
+
+        self.assertNotIn("mutated", second['primary_concepts'])
+
+
+class SectionPhilosopherSelectionTest(unittest.TestCase):
+    def test_title_themes_without_combined_concepts_still_guide_selection(self):
+        title_themes = {
+            'primary_concepts': ['simulacra'],
+            'primary_terms': [],
+            'related_concepts': [],
+        }
+        expected = find_relevant_philosophers(['simulacra'], [], philosopher_concepts)
+        self.assertTrue(expected)
+
+        random.seed(0)
+        philosopher = _select_section_philosopher(
+            "no such concept", "no such term", None, title_themes=title_themes
+        )
+
+        self.assertIn(philosopher, expected)
+
+
+if __name__ == "__main__":
+    unittest.main()